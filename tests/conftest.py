@@ -363,7 +363,7 @@ def _install_openpyxl_stub() -> None:
             self.column_dimensions = _ColumnDimensions()
 
         def append(self, row):
-            self.rows.append(list(row))
+            self.rows.append([getattr(value, "value", value) for value in row])
 
         def __getitem__(self, key):
             if key != 1:
@@ -386,17 +386,39 @@ def _install_openpyxl_stub() -> None:
                 columns.append(column)
             return columns
 
+    class WriteOnlyCell:
+        def __init__(self, _worksheet=None, value=None):
+            self.value = value
+            self.font = None
+
     class Workbook:
-        def __init__(self):
+        def __init__(self, write_only=False):
+            self.active = Worksheet()
+
+        def create_sheet(self, title=None):
             self.active = Worksheet()
+            if title is not None:
+                self.active.title = title
+            return self.active
 
         def save(self, path):
-            Path(path).write_text(json.dumps(self.active.rows), encoding="utf-8")
+            payload = json.dumps(self.active.rows)
+            if hasattr(path, "write"):
+                path.write(payload.encode("utf-8"))
+            else:
+                Path(path).write_text(payload, encoding="utf-8")
+
+    openpyxl_cell_module = types.ModuleType("openpyxl.cell")
+    openpyxl_utils_module = types.ModuleType("openpyxl.utils")
 
     openpyxl_module.Workbook = Workbook
+    openpyxl_cell_module.WriteOnlyCell = WriteOnlyCell
     openpyxl_styles_module.Font = Font
+    openpyxl_utils_module.get_column_letter = lambda index: chr(64 + index)
     sys.modules["openpyxl"] = openpyxl_module
+    sys.modules["openpyxl.cell"] = openpyxl_cell_module
     sys.modules["openpyxl.styles"] = openpyxl_styles_module
+    sys.modules["openpyxl.utils"] = openpyxl_utils_module
 
 
 def _install_matplotlib_stub() -> None:
@@ -442,8 +464,11 @@ def _install_folium_stub() -> None:
             self.children.append(child)
             return child
 
+        def render(self, **_kwargs):
+            return "<html></html>"
+
         def save(self, path):
-            Path(path).write_text("<html></html>", encoding="utf-8")
+            Path(path).write_text(self.render(), encoding="utf-8")
 
     class TileLayer(_Base):
         pass
@@ -457,6 +482,9 @@ def _install_folium_stub() -> None:
     class Popup(_Base):
         pass
 
+    class GeoJsonPopup(_Base):
+        pass
+
     class Icon(_Base):
         pass
 
@@ -471,6 +499,7 @@ def _install_folium_stub() -> None:
     folium_module.FeatureGroup = FeatureGroup
     folium_module.GeoJson = GeoJson
     folium_module.Popup = Popup
+    folium_module.GeoJsonPopup = GeoJsonPopup
     folium_module.Icon = Icon
     folium_module.Marker = Marker
     folium_module.LayerControl = LayerControl
@@ -40,6 +40,16 @@ class FakeSeries:
     def apply(self, func):
         return FakeSeries([func(value) for value in self.values])
 
+    def fillna(self, fill_value):
+        return FakeSeries([fill_value if value is None else value for value in self.values])
+
+    @property
+    def __geo_interface__(self):
+        return FakeFrame([{"geometry": value} for value in self.values]).__geo_interface__
+
+    def to_wkt(self, **_kwargs):
+        return FakeSeries([None if value is None else value.wkt for value in self.values])
+
     def isin(self, candidates):
         return [value in candidates for value in self.values]
 
@@ -236,6 +246,12 @@ class FakeFrame:
     def copy(self):
         return FakeFrame(copy.deepcopy(self.rows))
 
+    def assign(self, **columns):
+        frame = self.copy()
+        for key, value in columns.items():
+            frame[key] = list(value)
+        return frame
+
     def iterrows(self):
         for index, row in enumerate(self.rows):
             yield index, FakeRow(row)
@@ -264,7 +280,7 @@ class FakeFrame:
             unique.append(row)
         return FakeFrame(unique)
 
-    def groupby(self, group_cols, dropna=False, sort=False):
+    def groupby(self, group_cols, dropna=False, sort=False, observed=False):
         return FakeGroupBy(self, group_cols)
 
     def apply(self, func, axis=0):
@@ -300,7 +316,7 @@ class FakeFrame:
     def to_json(self):
         return json.dumps(self.__geo_interface__)
 
-    def to_file(self, path):
+    def to_file(self, path, driver=None, **_options):
         with open(path, "w", encoding="utf-8") as handle:
             json.dump(self.__geo_interface__, handle)
 
@@ -154,3 +154,24 @@ def test_make_get_cloudiness_for_row_respects_14_day_limit(monkeypatch):
     assert values[0] == 33.0
     assert values[1] is None
     assert captured[0] == 210
+
+
+def test_make_get_cloudiness_batch_returns_one_list_per_collect(monkeypatch):
+    captured = []
+    monkeypatch.setattr(
+        cloudiness,
+        "get_overpass_cloudiness",
+        lambda polygon_geojson, target_datetime, num_samples, allow_nearest, sampling_method: captured.append(target_datetime) or 21.0,
+    )
+
+    soon = datetime.now(timezone.utc) + timedelta(days=1)
+    later = datetime.now(timezone.utc) + timedelta(days=30)
+    get_batch = cloudiness.make_get_cloudiness_batch(FakePolygon("aoi"))
+
+    values = get_batch(
+        [FakePolygon("first"), FakePolygon("second")],
+        [[soon, later], soon],
+    )
+
+    assert values == [[21.0, None], [21.0]]
+    assert captured == [soon, soon]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 import utils.collection_builder as collection_builder
 
 from tests.helpers import FakeFrame, FakePolygon
@@ -40,6 +42,51 @@ def test_sync_scratch_directory_deletes_obsolete_and_downloads_missing(monkeypat
     assert local_paths == [tmp_path / "sentinel1_new.kml"]
 
 
+def test_sync_scratch_directory_downloads_each_path_once_and_skips_failures(monkeypatch, tmp_path):
+    errors = []
+    logger = type(
+        "Logger",
+        (),
+        {
+            "info": lambda self, *args: None,
+            "error": lambda self, message, *args: errors.append(message % args),
+        },
+    )()
+
+    downloads = []
+
+    def fake_download(url, path):
+        downloads.append(url)
+        if "bad" in url:
+            raise OSError("offline")
+
+    monkeypatch.setattr(collection_builder, "download_kml", fake_download)
+
+    local_paths = collection_builder.sync_scratch_directory(
+        [
+            "https://example.com/a.kml",
+            "https://example.com/bad.kml",
+            "https://example.com/b.kml",
+            "https://example.com/a.kml",
+        ],
+        "sentinel1",
+        tmp_path,
+        logger,
+    )
+
+    assert sorted(downloads) == [
+        "https://example.com/a.kml",
+        "https://example.com/b.kml",
+        "https://example.com/bad.kml",
+    ]
+    assert local_paths == [
+        tmp_path / "sentinel1_a.kml",
+        tmp_path / "sentinel1_b.kml",
+        tmp_path / "sentinel1_a.kml",
+    ]
+    assert errors == ["Failed downloading https://example.com/bad.kml: offline"]
+
+
 def test_build_sentinel_collection_uses_cached_and_parsed_files(monkeypatch, tmp_path):
     logger = type(
         "Logger",
@@ -51,8 +98,8 @@ def test_build_sentinel_collection_uses_cached_and_parsed_files(monkeypatch, tmp
     kml_b = tmp_path / "sentinel1_beta.kml"
     kml_a.write_text("a", encoding="utf-8")
     kml_b.write_text("b", encoding="utf-8")
-    cached_geojson = tmp_path / "sentinel1_alpha.geojson"
-    cached_geojson.write_text("{}", encoding="utf-8")
+    cached_collection = tmp_path / "sentinel1_alpha.fgb"
+    cached_collection.write_text("{}", encoding="utf-8")
 
     old_date = datetime.now(timezone.utc) - timedelta(days=40)
     new_date = datetime.now(timezone.utc) - timedelta(days=2)
@@ -74,17 +121,21 @@ def test_build_sentinel_collection_uses_cached_and_parsed_files(monkeypatch, tmp
     )
     monkeypatch.setattr(collection_builder.pd, "to_datetime", lambda values, utc=True: values)
 
-    output = collection_builder.build_sentinel_collection(
+    output, built = collection_builder.build_sentinel_collection(
         urls=["https://example.com/alpha.kml", "https://example.com/beta.kml"],
         n_day_past=13,
         mission_name="sentinel1",
-        out_filename="out.geojson",
+        out_filename="out.fgb",
         logger=logger,
         platforms=["S1A", "S1C"],
     )
 
-    assert output == tmp_path / "out.geojson"
+    assert output == tmp_path / "out.fgb"
     assert output.exists()
+    assert (tmp_path / "sentinel1_beta.fgb").exists()
+
+    # The merged frame is returned alongside the file it was written to
+    assert isinstance(built, FakeFrame)
 
 
 def test_build_sentinel_collection_returns_empty_path_when_no_frames(monkeypatch, tmp_path):
@@ -102,7 +153,7 @@ def test_build_sentinel_collection_returns_empty_path_when_no_frames(monkeypatch
     )
     monkeypatch.setattr(collection_builder, "parse_kml", lambda path: (_ for _ in ()).throw(ValueError("bad kml")))
 
-    output = collection_builder.build_sentinel_collection(
+    output, built = collection_builder.build_sentinel_collection(
         urls=["https://example.com/broken.kml"],
         n_day_past=13,
         mission_name="sentinel1",
@@ -111,3 +162,32 @@ def test_build_sentinel_collection_returns_empty_path_when_no_frames(monkeypatch
     )
 
     assert output == collection_builder.Path()
+    assert built is None
+
+
+def test_collection_file_round_trip_keeps_begin_date_order(tmp_path):
+    pytest.importorskip("pyogrio")
+    gpd = pytest.importorskip("geopandas")
+    box = pytest.importorskip("shapely.geometry").box
+    start = datetime(2026, 3, 20, tzinfo=timezone.utc)
+    # Footprints scattered so a spatial index would reorder them
+    offsets = [50, -120, 10, 170, -60, 90, -10, 130]
+    plan = gpd.GeoDataFrame(
+        {
+            "begin_date": [start + timedelta(hours=hour) for hour in range(len(offsets))],
+            "orbit_relative": list(range(len(offsets))),
+            "geometry": [box(x, (x % 7) - 3, x + 1, (x % 7) - 2) for x in offsets],
+        },
+        crs="EPSG:4326",
+    )
+    path = tmp_path / f"plan{collection_builder.COLLECTION_SUFFIX}"
+
+    plan.to_file(
+        path,
+        driver=collection_builder.COLLECTION_DRIVER,
+        **collection_builder.COLLECTION_WRITE_OPTIONS,
+    )
+    loaded = collection_builder.read_collection(path)
+
+    assert loaded["orbit_relative"].tolist() == list(range(len(offsets)))
+    assert loaded["begin_date"].is_monotonic_increasing
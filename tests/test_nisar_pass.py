@@ -195,3 +195,12 @@ def test_estimate_nisar_overpass_time_dateline_descending_double_rollover():
     assert result.hour == 5
     assert result.minute == 40
 
+
+def test_format_pass_dates_returns_first_time_and_marked_dates():
+    past = datetime(2020, 1, 1, 6, 5, tzinfo=timezone.utc)
+    future = datetime(2099, 1, 2, 18, 0, tzinfo=timezone.utc)
+
+    first_times, dates = nisar_pass._format_pass_dates([[past, future], future, []])
+
+    assert first_times == ["06:05", "18:00", None]
+    assert dates == [["2020-01-01 (P)", "2099-01-02"], ["2099-01-02"], []]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import types
 import zipfile
-from datetime import datetime, timezone
+from collections import OrderedDict
 
+import pandas as pd
 import pytest
 
 import utils.opera_products as opera_products
@@ -24,18 +26,30 @@ def test_find_print_available_opera_products_validates_date_range(tmp_path):
 
 def test_find_print_available_opera_products_prefixes_products_and_trims_dates(monkeypatch, tmp_path):
     searches = []
-    rows = FakeFrame(
-        [
-            {"BeginningDateTime": datetime(2026, 3, 20, 10, tzinfo=timezone.utc), "geometry": FakePolygon("g1")},
-            {"BeginningDateTime": datetime(2026, 3, 20, 12, tzinfo=timezone.utc), "geometry": FakePolygon("g2")},
-            {"BeginningDateTime": datetime(2026, 3, 18, 8, tzinfo=timezone.utc), "geometry": FakePolygon("g3")},
-        ]
+    rows = pd.DataFrame(
+        {
+            "BeginningDateTime": [
+                "2026-03-20T10:00:00.000Z",
+                "2026-03-20T12:00:00.000Z",
+                "2026-03-18T08:00:00.000Z",
+                "2026-03-19T08:00:00.000Z",
+            ],
+            "geometry": ["g1", "g2", "g3", "g4"],
+        }
     )
 
+    def granule(granule_id, short_name):
+        return {"id": granule_id, "umm": {"CollectionReference": {"ShortName": short_name}}}
+
     def fake_search(short_name, cloud_hosted, bounding_box, temporal, return_gdf):
         searches.append(short_name)
         return (
-            [{"id": "a"}, {"id": "b"}, {"id": "c"}],
+            [
+                granule("a", "OPERA_L2_RTC-S1_V1"),
+                granule("b", "OPERA_L2_RTC-S1_V1"),
+                granule("c", "OPERA_L2_RTC-S1_V1"),
+                granule("d", "OPERA_L3_DSWX-HLS_V1"),
+            ],
             rows.copy(),
         )
 
@@ -46,7 +60,6 @@ def test_find_print_available_opera_products_prefixes_products_and_trims_dates(m
         "bbox_to_geometry",
         lambda bbox, timestamp_dir: (FakePolygon("aoi"), [0, 1, 2, 3], None),
     )
-    monkeypatch.setattr(opera_products.pd, "to_datetime", lambda values: values)
     monkeypatch.setattr(opera_products.time, "sleep", lambda seconds: None)
 
     result = opera_products.find_print_available_opera_products(
@@ -57,8 +70,99 @@ def test_find_print_available_opera_products_prefixes_products_and_trims_dates(m
         timestamp_dir=tmp_path,
     )
 
-    assert searches == ["OPERA_L2_RTC-S1_V1", "OPERA_L3_DSWX-HLS_V1"]
-    assert len(result["OPERA_L2_RTC-S1_V1"]["results"]) == 2
+    assert searches == [["OPERA_L2_RTC-S1_V1", "OPERA_L3_DSWX-HLS_V1"]]
+    assert [item["id"] for item in result["OPERA_L2_RTC-S1_V1"]["results"]] == ["a", "b"]
+    assert [item["id"] for item in result["OPERA_L3_DSWX-HLS_V1"]["results"]] == ["d"]
+    assert list(result["OPERA_L2_RTC-S1_V1"]["gdf"]["BeginningDateTime"]) == [
+        "2026-03-20T10:00:00Z",
+        "2026-03-20T12:00:00Z",
+    ]
+
+
+def test_find_print_available_opera_products_matches_short_names_case_insensitively(monkeypatch, tmp_path):
+    rows = pd.DataFrame(
+        {
+            "BeginningDateTime": ["2026-03-20T10:00:00.000Z", "2026-03-20T12:00:00.000Z"],
+            "geometry": ["g1", "g2"],
+        }
+    )
+
+    def fake_search(short_name, cloud_hosted, bounding_box, temporal, return_gdf):
+        return (
+            [
+                {"id": "a", "umm": {"CollectionReference": {"ShortName": "OPERA_L3_DSWX-HLS_V1"}}},
+                {"id": "b", "umm": {"CollectionReference": {"ShortName": "OPERA_L3_DSWX-HLS_V1"}}},
+            ],
+            rows.copy(),
+        )
+
+    monkeypatch.setattr(opera_products.leafmap, "nasa_data_search", fake_search)
+    monkeypatch.setattr(opera_products, "bbox_type", lambda bbox: bbox)
+    monkeypatch.setattr(
+        opera_products,
+        "bbox_to_geometry",
+        lambda bbox, timestamp_dir: (FakePolygon("aoi"), [0, 1, 2, 3], None),
+    )
+
+    result = opera_products.find_print_available_opera_products(
+        bbox=[34.2, -118.17],
+        number_of_dates=1,
+        date_str="2026-03-23",
+        list_of_products=["DSWx-HLS_V1"],
+        timestamp_dir=tmp_path,
+    )
+
+    # Granules land under the canonical name CMR returned
+    assert list(result) == ["OPERA_L3_DSWX-HLS_V1"]
+    assert [item["id"] for item in result["OPERA_L3_DSWX-HLS_V1"]["results"]] == ["a", "b"]
+
+
+def test_find_print_available_opera_products_does_not_retry_client_errors(monkeypatch, tmp_path):
+    calls = []
+
+    class BadRequest(Exception):
+        response = types.SimpleNamespace(status_code=400)
+
+    def fake_search(**_kwargs):
+        calls.append(1)
+        try:
+            raise BadRequest("bad bounding box")
+        except BadRequest as error:
+            raise RuntimeError("CMR search failed") from error
+
+    monkeypatch.setattr(opera_products.leafmap, "nasa_data_search", fake_search)
+    monkeypatch.setattr(opera_products, "bbox_type", lambda bbox: bbox)
+    monkeypatch.setattr(
+        opera_products,
+        "bbox_to_geometry",
+        lambda bbox, timestamp_dir: (FakePolygon("aoi"), [0, 1, 2, 3], None),
+    )
+    monkeypatch.setattr(opera_products.time, "sleep", lambda seconds: None)
+
+    result = opera_products.find_print_available_opera_products([34.2, -118.17], 1, "2026-03-23", None, tmp_path)
+
+    assert result == {}
+    assert len(calls) == 1
+
+
+def test_shrink_keeps_columns_and_downcasts():
+    gdf = pd.DataFrame(
+        {
+            "GranuleUR": ["g1", "g2", "g3", "g4", "g5", "g6"],
+            "DayNightFlag": ["Day", "Day", "Day", "Day", "Night", "Night"],
+            "RelatedUrls": [[{"URL": "u"}]] * 6,
+            "OrbitNumber": [1, 2, 3, 4, 5, 6],
+            "CloudCover": [0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+        }
+    )
+
+    shrunk = opera_products._shrink(gdf)
+
+    assert shrunk["RelatedUrls"].tolist() == [[{"URL": "u"}]] * 6
+    assert shrunk["GranuleUR"].dtype != "category"
+    assert shrunk["DayNightFlag"].dtype == "category"
+    assert shrunk["OrbitNumber"].dtype == "int8"
+    assert shrunk["CloudCover"].dtype == "float32"
 
 
 def test_export_opera_products_writes_workbook_and_skips_cloudiness_when_disabled(tmp_path):
@@ -107,3 +211,82 @@ def test_export_opera_products_writes_workbook_and_skips_cloudiness_when_disable
         assert payload[0][0] == "Dataset"
         assert payload[1][1] == "granule-1"
         assert payload[1][5] == "https://example.com/file_B01_WTR.tif"
+
+
+def test_export_opera_products_fetches_each_cloud_layer_once(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_get_cloudiness(url):
+        calls.append(url)
+        return 40.0, 10.0
+
+    monkeypatch.setattr(opera_products, "get_cloudiness", fake_get_cloudiness)
+    monkeypatch.setattr(opera_products, "_CLOUDINESS_CACHE", OrderedDict())
+    cloud_url = "https://example.com/file_B09_CLOUD.tif"
+    granule = {"umm": {"GranuleUR": "granule-1", "RelatedUrls": [{"URL": cloud_url}]}}
+    results_dict = {
+        "OPERA_L3_DSWX-HLS_V1": {
+            "results": [granule, granule],
+            "gdf": FakeFrame([{"geometry": FakePolygon("g1")}, {"geometry": FakePolygon("g2")}]),
+        }
+    }
+
+    opera_products.export_opera_products(results_dict, tmp_path)
+    opera_products.export_opera_products(results_dict, tmp_path)
+
+    assert calls == [cloud_url]
+    output_file = tmp_path / "opera_products_metadata.xlsx"
+    if zipfile.is_zipfile(output_file):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(output_file)["OPERA Metadata"]
+        assert sheet["E2"].value == 40.0
+        assert sheet["E3"].value == 40.0
+    else:
+        payload = json.loads(output_file.read_text(encoding="utf-8"))
+        assert payload[1][4] == 40.0
+        assert payload[2][4] == 40.0
+
+
+def test_cached_cloudiness_evicts_least_recent_and_skips_failures(monkeypatch):
+    calls = []
+
+    def fake_get_cloudiness(url):
+        calls.append(url)
+        return None if url == "bad" else (float(len(calls)), 0.0)
+
+    monkeypatch.setattr(opera_products, "get_cloudiness", fake_get_cloudiness)
+    monkeypatch.setattr(opera_products, "_CLOUDINESS_CACHE", OrderedDict())
+    monkeypatch.setattr(opera_products, "_CLOUDINESS_CACHE_SIZE", 2)
+
+    for url in ["a", "b", "a", "c", "bad", "bad", "a", "b"]:
+        opera_products._cached_cloudiness(url)
+
+    # "b" was least recently used when "c" arrived; failures are never stored
+    assert calls == ["a", "b", "c", "bad", "bad", "b"]
+    assert list(opera_products._CLOUDINESS_CACHE) == ["a", "b"]
+
+
+def test_classify_granule_urls_keeps_first_match_and_skips_non_data_urls():
+    umms = [
+        {
+            "RelatedUrls": [
+                {"URL": "s3://bucket/file_B01_WTR.tif"},
+                {"URL": "https://example.com/file_B01_WTR.png"},
+                {"URL": "https://example.com/first_B01_WTR.tif"},
+                {"URL": "https://example.com/second_B01_WTR.tif"},
+                {"URL": "https://example.com/file_B09_CLOUD.tif"},
+            ]
+        },
+        {},
+        {"RelatedUrls": [{"URL": "https://example.com/file_30_v1.0_VV.tif"}]},
+    ]
+
+    first, empty, rtc = opera_products.classify_granule_urls(umms)
+
+    assert first["water"] == "https://example.com/first_B01_WTR.tif"
+    assert first["cloud"] == "https://example.com/file_B09_CLOUD.tif"
+    assert first["rtc-vv"] == "N/A"
+    assert set(empty.values()) == {"N/A"}
+    assert rtc["rtc-vv"] == "https://example.com/file_30_v1.0_VV.tif"
+    assert rtc["water"] == "N/A"
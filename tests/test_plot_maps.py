@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import geopandas as gpd
+import pytest
+
 import utils.plot_maps as plot_maps
 
 from tests.helpers import FakeFrame, FakePolygon
@@ -16,7 +19,7 @@ def _make_polygon(module, name="poly"):
 
 def _make_map_gdf(module, polygon):
     try:
-        gdf = module.gpd.GeoDataFrame(
+        gdf = gpd.GeoDataFrame(
             {"URL": [""], "GranuleUR": [""], "geometry": [polygon]},
             geometry="geometry",
             crs="EPSG:4326",
@@ -104,3 +107,99 @@ def test_make_overpasses_map_creates_output(tmp_path, monkeypatch):
     plot_maps.make_overpasses_map(result_s1, None, result_l, None, [34.2, -118.17], tmp_path)
 
     assert (tmp_path / "satellite_overpasses_map.html").exists()
+
+
+def test_distinct_color_generators_match_reference_loops():
+    import colorsys
+
+    expected_hsv = [
+        "#{:02x}{:02x}{:02x}".format(*[int(c * 255) for c in colorsys.hsv_to_rgb(i / 7.0, 1.0, 1.0)])
+        for i in range(7)
+    ]
+    assert plot_maps.hsl_distinct_colors(7) == expected_hsv
+    assert plot_maps.spread_rgb_colors(3) == ["#0055aa", "#55aaff", "#aaff54"]
+    assert plot_maps.hsl_distinct_colors(0) == []
+
+
+def test_hsl_distinct_colors_improved_is_reproducible():
+    colors = plot_maps.hsl_distinct_colors_improved(5)
+
+    assert colors == plot_maps.hsl_distinct_colors_improved(5)
+    assert len(set(colors)) == 5
+
+
+def test_style_functions_are_shared_per_color():
+    style_fn = plot_maps._make_style_fn("#123456")
+
+    assert style_fn is plot_maps._make_style_fn("#123456")
+    assert style_fn({}) == {
+        "color": "#123456",
+        "fillColor": "#123456",
+        "weight": 2,
+        "fillOpacity": 0.5,
+    }
+    assert plot_maps._make_style_fn("red", 0.3, fill=False)({}) == {
+        "color": "red",
+        "weight": 2,
+        "fillOpacity": 0.3,
+    }
+
+
+def test_parse_compact_utc_matches_strptime():
+    stamp = "20260321T134502Z"
+
+    assert plot_maps._parse_compact_utc(stamp) == datetime.strptime(
+        stamp, "%Y%m%dT%H%M%SZ"
+    ).replace(tzinfo=timezone.utc)
+    for bad in ("20260321", "20260321T134502", "20261321T134502Z"):
+        with pytest.raises(ValueError):
+            plot_maps._parse_compact_utc(bad)
+
+
+def test_color_palettes_are_cached_but_returned_as_fresh_lists():
+    plot_maps.hsl_distinct_colors_improved.cache_clear()
+    first = plot_maps.hsl_distinct_colors_improved(4)
+    first.append("#000000")
+
+    second = plot_maps.hsl_distinct_colors_improved(4)
+
+    assert len(second) == 4
+    assert plot_maps.hsl_distinct_colors_improved.cache_info().hits == 1
+
+
+def test_save_map_writes_rendered_html_in_slices(tmp_path):
+    html = "<html>é\r\n" + "x" * 25 + "</html>"
+    root = type("Root", (), {"render": lambda self: html})()
+    map_object = type("Map", (), {"get_root": lambda self: root})()
+
+    plot_maps._save_map(map_object, tmp_path / "map.html", chunk_size=4)
+
+    assert (tmp_path / "map.html").read_bytes() == html.encode("utf-8")
+
+
+def test_add_swath_layer_builds_one_styled_layer(monkeypatch):
+    layers = []
+
+    class RecordingGeoJson:
+        def __init__(self, data, **kwargs):
+            self.data = data
+            self.kwargs = kwargs
+
+        def add_to(self, parent):
+            layers.append(self)
+
+    monkeypatch.setattr(plot_maps.folium, "GeoJson", RecordingGeoJson)
+    polygon = _make_polygon(plot_maps)
+
+    plot_maps._add_swath_layer(None, [], name="empty")
+    plot_maps._add_swath_layer(
+        None,
+        [(polygon, "red", "<b>A</b>"), (polygon, "blue", "<b>B</b>")],
+        name="Sentinel-1 Areas",
+    )
+
+    assert len(layers) == 1
+    features = layers[0].data["features"]
+    assert [feature["properties"]["popup"] for feature in features] == ["<b>A</b>", "<b>B</b>"]
+    style_function = layers[0].kwargs["style_function"]
+    assert style_function(features[1]) == {"color": "blue", "weight": 2, "fillOpacity": 0.3}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from pathlib import Path
 
 import utils.sentinel_pass as sentinel_pass
 
@@ -41,17 +42,31 @@ def test_next_sentinel_pass_rejects_unknown_satellite():
 
 
 def test_next_sentinel_pass_handles_plan_read_error(monkeypatch):
-    monkeypatch.setattr(sentinel_pass.gpd, "read_file", lambda path: (_ for _ in ()).throw(OSError("missing")))
-    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: "missing.geojson")
+    monkeypatch.setattr(
+        sentinel_pass,
+        "create_s1_collection_plan",
+        lambda n_day_past: (_ for _ in ()).throw(OSError("missing")),
+    )
 
     result = sentinel_pass.next_sentinel_pass("sentinel1", FakePolygon("aoi"), 13, False)
 
     assert result["next_collect_info"] == "Error reading plan file."
 
 
+def test_next_sentinel_pass_handles_failed_plan_build(monkeypatch):
+    monkeypatch.setattr(sentinel_pass, "create_s2_collection_plan", lambda n_day_past: (Path(), None))
+
+    result = sentinel_pass.next_sentinel_pass("sentinel2", FakePolygon("aoi"), 13, False)
+
+    assert result == {
+        "next_collect_info": "Error reading plan file.",
+        "next_collect_geometry": None,
+        "intersection_pct": None,
+    }
+
+
 def test_next_sentinel_pass_returns_grouped_results_without_cloudiness(monkeypatch):
-    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: "collection.geojson")
-    monkeypatch.setattr(sentinel_pass.gpd, "read_file", lambda path: FakeFrame([{"platform": "S1A"}]))
+    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: ("collection.fgb", FakeFrame([{"platform": "S1A"}])))
     monkeypatch.setattr(
         sentinel_pass,
         "find_intersecting_collects",
@@ -89,7 +104,8 @@ def test_next_sentinel_pass_returns_grouped_results_without_cloudiness(monkeypat
             ]
         ),
     )
-    monkeypatch.setattr(sentinel_pass, "format_collects", lambda grouped: "table")
+    grouped_frames = []
+    monkeypatch.setattr(sentinel_pass, "format_collects", lambda grouped: grouped_frames.append(grouped) or "table")
     monkeypatch.setattr(sentinel_pass, "build_collect_summaries", lambda grouped: ["summary"])
 
     result = sentinel_pass.next_sentinel_pass("sentinel1", FakePolygon("aoi"), 13, False)
@@ -97,11 +113,12 @@ def test_next_sentinel_pass_returns_grouped_results_without_cloudiness(monkeypat
     assert result["next_collect_info"] == "table"
     assert result["intersection_pct"] == [77.0]
     assert result["next_collect_summary"] == ["summary"]
+    # The repeated acquisition collapses into a single timestamp
+    assert grouped_frames[0]["begin_date"].tolist() == [[datetime(2026, 3, 20, tzinfo=timezone.utc)]]
 
 
 def test_next_sentinel_pass_returns_cloudiness_when_requested(monkeypatch):
-    monkeypatch.setattr(sentinel_pass, "create_s2_collection_plan", lambda n_day_past: "collection.geojson")
-    monkeypatch.setattr(sentinel_pass.gpd, "read_file", lambda path: FakeFrame([{}]))
+    monkeypatch.setattr(sentinel_pass, "create_s2_collection_plan", lambda n_day_past: ("collection.fgb", FakeFrame([{}])))
     monkeypatch.setattr(
         sentinel_pass,
         "find_intersecting_collects",
@@ -118,8 +135,8 @@ def test_next_sentinel_pass_returns_cloudiness_when_requested(monkeypatch):
     )
     monkeypatch.setattr(
         sentinel_pass,
-        "make_get_cloudiness_for_row",
-        lambda geometry: (lambda row: [12.5]),
+        "make_get_cloudiness_batch",
+        lambda geometry: (lambda geometries, date_lists: [[12.5] for _ in geometries]),
     )
     monkeypatch.setattr(sentinel_pass, "format_collects", lambda grouped: "cloudy-table")
     monkeypatch.setattr(sentinel_pass, "build_collect_summaries", lambda grouped: ["cloudy-summary"])
@@ -131,11 +148,10 @@ def test_next_sentinel_pass_returns_cloudiness_when_requested(monkeypatch):
 
 
 def test_next_sentinel_pass_returns_no_collect_message(monkeypatch):
-    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: "collection.geojson")
     monkeypatch.setattr(
-        sentinel_pass.gpd,
-        "read_file",
-        lambda path: FakeFrame([{"end_date": datetime(2026, 3, 30, tzinfo=timezone.utc)}]),
+        sentinel_pass,
+        "create_s1_collection_plan",
+        lambda n_day_past: ("collection.fgb", FakeFrame([{"end_date": datetime(2026, 3, 30, tzinfo=timezone.utc)}])),
     )
     monkeypatch.setattr(
         sentinel_pass,
@@ -152,8 +168,7 @@ def test_next_sentinel_pass_returns_tide_for_point_aoi(monkeypatch):
     """Regression test: --tide must work for point AOIs like -b 34.20 -118.17."""
     from tests.helpers import FakePoint
 
-    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: "collection.geojson")
-    monkeypatch.setattr(sentinel_pass.gpd, "read_file", lambda path: FakeFrame([{"platform": "S1A"}]))
+    monkeypatch.setattr(sentinel_pass, "create_s1_collection_plan", lambda n_day_past: ("collection.fgb", FakeFrame([{"platform": "S1A"}])))
     monkeypatch.setattr(
         sentinel_pass,
         "find_intersecting_collects",
@@ -186,3 +201,16 @@ def test_next_sentinel_pass_returns_tide_for_point_aoi(monkeypatch):
     assert result["tide"] == [[{"nearest": "1.23(H-rising)", "per_station": {"9432780": "1.23(H-rising)"}}]]
     assert result["noaa_stations"] == [{"id": "9432780", "name": "LA", "lat": 34.0, "lng": -118.0}]
 
+
+def test_format_date_cells_wraps_rows_and_marks_past_dates():
+    past = datetime(2020, 1, 1, 10, 0, tzinfo=timezone.utc)
+    future = datetime(2099, 1, 2, 10, 0, 1, tzinfo=timezone.utc)
+
+    cells = sentinel_pass.format_date_cells([[past, future, future], [], [future]], per_line=2)
+
+    assert cells == [
+        "2020-01-01 10:00:00 (P), 2099-01-02 10:00:01\n2099-01-02 10:00:01",
+        "",
+        "2099-01-02 10:00:01",
+    ]
+    assert sentinel_pass.format_date_lines([past]) == "2020-01-01 10:00:00 (P)"
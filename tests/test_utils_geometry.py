@@ -61,6 +61,23 @@ def test_bbox_to_geometry_loads_wkt_and_downloaded_url(monkeypatch, tmp_path):
     assert url_geom.x == 1
 
 
+def test_bbox_to_geometry_reads_each_aoi_file_once(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_geometry_from_file(path):
+        calls.append(path)
+        return utils_mod.Point(1, 2)
+
+    monkeypatch.setattr(utils_mod, "geometry_from_file", fake_geometry_from_file)
+    aoi_path = str(tmp_path / "aoi.kml")
+
+    first = utils_mod.bbox_to_geometry(aoi_path, tmp_path)
+    second = utils_mod.bbox_to_geometry(aoi_path, tmp_path)
+
+    assert first == second
+    assert len(calls) == 1
+
+
 def test_download_url_to_file_ensures_geojson_suffix_and_validates_json(monkeypatch, tmp_path):
     class FakeResponse:
         def raise_for_status(self):
@@ -117,6 +134,25 @@ def test_is_date_in_text_handles_millis_and_plain_seconds():
     assert not utils_mod.is_date_in_text("2025-10-10T04:41:14Z", "window 2025-10-11")
 
 
+def test_extract_umm_fields_reads_times_and_get_data_url():
+    umm = {
+        "GranuleUR": "granule-1",
+        "TemporalExtent": {"RangeDateTime": {"BeginningDateTime": "2026-03-20T00:00:00Z"}},
+        "RelatedUrls": [
+            {"Type": "GET RELATED VISUALIZATION", "URL": "https://example.com/browse.png"},
+            {"Type": "GET DATA", "URL": "https://example.com/granule.tif"},
+        ],
+    }
+
+    assert utils_mod.extract_umm_fields(umm) == (
+        "granule-1",
+        "2026-03-20T00:00:00Z",
+        "N/A",
+        "https://example.com/granule.tif",
+    )
+    assert utils_mod.extract_umm_fields({}, default_id="OPERA Granule") == ("OPERA Granule", "N/A", "N/A", "N/A")
+
+
 def test_style_function_factory_and_valid_drcs_datetime():
     style = utils_mod.style_function_factory("red", inactive_color="gray")
     assert style({"properties": {"condition_ok": True}})["color"] == "red"
@@ -130,21 +166,64 @@ def test_style_function_factory_and_valid_drcs_datetime():
         utils_mod.valid_drcs_datetime("2026/03/23 10:00")
 
 
+def test_check_opera_overpass_intersection_reuses_overpass_index(monkeypatch):
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    box = shapely_geometry.box
+    result_s1 = {
+        "next_collect_info": "\n".join(
+            [
+                "|   # | Mission | Rel. orbit | Passes dates |",
+                "| 1 | S1A | 64 | 2026-03-25 10:00:00 |",
+                "| 2 | S1C | 137 | 2026-03-22 10:00:00, 2099-01-01 10:00:00 |",
+                "| 3 | S1A | 12 | 2026-03-24 10:00:00 |",
+            ]
+        ),
+        "next_collect_geometry": [box(0, 0, 2, 2), box(1, 1, 3, 3), box(10, 10, 11, 11)],
+    }
+    index = utils_mod.build_overpass_index(result_s1, None, {})
+    assert index["Sentinel-2"] is None and index["Landsat"] is None
+    monkeypatch.setattr(utils_mod, "build_overpass_index", lambda *args: pytest.fail("rebuilt"))
+
+    report = utils_mod.check_opera_overpass_intersection(
+        "OPERA_L2_RTC-S1_T064_S1A",
+        box(0, 0, 2, 2),
+        result_s1,
+        None,
+        {},
+        dt.datetime(2026, 3, 21, tzinfo=dt.timezone.utc),
+        dataset_name="OPERA_L2_RTC-S1_V1",
+        overpass_index=index,
+    )
+
+    lines = report.split("\n")
+    assert lines[0] == "Sentinel-1 acquired data post-event on:"
+    assert "2026-03-22 10:00:00 (UTC)" in lines[1] and "S1C, Rel. orbit 137, 25.0% overlap" in lines[1]
+    assert "2026-03-25 10:00:00 (UTC)" in lines[2] and "S1A, Rel. orbit 64, 100.0% overlap" in lines[2]
+    assert lines[3] == "and will acquire data on:"
+    assert "2099-01-01 10:00:00 (UTC)" in lines[4]
+    assert "Rel. orbit 12" not in report
+
+
 def test_scrape_esa_download_urls_normalizes_malformed_links(monkeypatch):
     class FakeResponse:
-        text = """
+        content = """
         <html>
-          <div class='sentinel-1a'>
+          <div class='plan sentinel-1a'>
             <a href='https://sentinel/path-1.kml'>one</a>
             <a href='/path-2.kml'>two</a>
           </div>
+          <div class='sentinel-1c'>
+            <a href='/other.kml'>other</a>
+          </div>
         </html>
-        """
+        """.encode()
 
         def raise_for_status(self):
             return None
 
-    monkeypatch.setattr(utils_mod.requests, "get", lambda url: FakeResponse())
+    requested = []
+    monkeypatch.setattr(utils_mod, "_ESA_PAGE_CACHE", {})
+    monkeypatch.setattr(utils_mod.ESA_SESSION, "get", lambda url: requested.append(url) or FakeResponse())
 
     urls = utils_mod.scrape_esa_download_urls("https://example.com", "sentinel-1a")
 
@@ -152,34 +231,63 @@ def test_scrape_esa_download_urls_normalizes_malformed_links(monkeypatch):
         "https://sentinels.copernicus.eu/path-1.kml",
         "https://sentinels.copernicus.eu/path-2.kml",
     ]
+    assert utils_mod.scrape_esa_download_urls("https://example.com", "sentinel-1c") == [
+        "https://sentinels.copernicus.eu/other.kml",
+    ]
+    assert requested == ["https://example.com"]
 
 
-def test_get_spatial_extent_km_uses_projected_bounds(monkeypatch):
-    class FakeArea:
-        def sum(self):
-            return 5_000_000
+def test_fetch_esa_page_only_serializes_same_url(monkeypatch):
+    import threading
 
-    class FakeProjectedFrame:
-        total_bounds = [0, 0, 2000, 3000]
+    class FakeResponse:
+        content = b"<html><div class='sentinel-1a'></div></html>"
+
+        def raise_for_status(self):
+            return None
+
+    other_started = threading.Event()
+
+    def fake_get(url):
+        if url == "https://example.com/one":
+            # Only returns once the other page's fetch is in flight
+            assert other_started.wait(timeout=5)
+        else:
+            other_started.set()
+        return FakeResponse()
+
+    monkeypatch.setattr(utils_mod, "_ESA_PAGE_CACHE", {})
+    monkeypatch.setattr(utils_mod, "_ESA_PAGE_LOCKS", {})
+    monkeypatch.setattr(utils_mod.ESA_SESSION, "get", fake_get)
+
+    errors = []
 
-        class _Geom:
-            area = FakeArea()
+    def fetch(url):
+        try:
+            utils_mod._fetch_esa_page(url)
+        except AssertionError as error:
+            errors.append(error)
 
-        geometry = _Geom()
+    first = threading.Thread(target=fetch, args=("https://example.com/one",))
+    first.start()
+    fetch("https://example.com/two")
+    first.join()
 
-    class FakeFrame:
-        def __init__(self, geometry=None, crs=None):
-            self.geometry = geometry
+    assert errors == []
+    assert set(utils_mod._ESA_PAGE_CACHE) == {"https://example.com/one", "https://example.com/two"}
 
-        def to_crs(self, epsg=None):
-            return FakeProjectedFrame()
 
-    monkeypatch.setattr(utils_mod.gpd, "GeoDataFrame", FakeFrame)
-    monkeypatch.setattr(utils_mod, "shape", lambda geojson: FakeGeometry(area=10.0))
+def test_get_spatial_extent_km_uses_local_utm_zone():
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    # 0.1 x 0.1 degree cell at 60N: about 5.6 km wide and 11.1 km tall
+    aoi = shapely_geometry.mapping(shapely_geometry.box(10.0, 60.0, 10.1, 60.1))
 
-    result = utils_mod.get_spatial_extent_km({"type": "Polygon", "coordinates": []})
+    result = utils_mod.get_spatial_extent_km(aoi)
 
-    assert result == {"width_km": 2.0, "height_km": 3.0, "area_km2": 5.0}
+    assert result["width_km"] == pytest.approx(5.6, abs=0.3)
+    assert result["height_km"] == pytest.approx(11.1, abs=0.3)
+    # Web Mercator would report roughly four times this area at 60N
+    assert result["area_km2"] == pytest.approx(62.0, rel=0.02)
 
 
 def test_filter_dates_beyond_window_with_datetime_objects():
@@ -348,3 +456,64 @@ def test_filter_dates_beyond_window_requires_date_format_for_strings():
     # Should raise ValueError when date_format is not provided
     with pytest.raises(ValueError, match="date_format required"):
         utils_mod.filter_dates_beyond_window(dates, tides, max_days=60)
+
+
+def test_find_intersecting_collects_keeps_only_overlapping_footprints():
+    gpd = pytest.importorskip("geopandas")
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    box = shapely_geometry.box
+    gdf = gpd.GeoDataFrame(
+        {
+            "begin_date": ["2026-03-22", "2026-03-21", "2026-03-23"],
+            "orbit_relative": [1, 2, 3],
+            "geometry": [box(0, 0, 1, 1), box(5, 5, 6, 6), box(0.5, 0, 1.5, 1)],
+        },
+        crs="EPSG:4326",
+    )
+
+    result = utils_mod.find_intersecting_collects(gdf, box(0, 0, 1, 1))
+
+    assert result["orbit_relative"].tolist() == [1, 3]
+    assert result["intersection_pct"].round().tolist() == [100.0, 50.0]
+
+    # Footprints that contain the AOI are reported as full coverage
+    inner_result = utils_mod.find_intersecting_collects(gdf, box(0.6, 0.2, 0.9, 0.8))
+    assert inner_result["orbit_relative"].tolist() == [1, 3]
+    assert inner_result["intersection_pct"].tolist() == [100.0, 100.0]
+
+    # A point on a shared edge still counts, as with intersects
+    point_result = utils_mod.find_intersecting_collects(gdf, shapely_geometry.Point(1, 0.5))
+    assert point_result["orbit_relative"].tolist() == [1, 3]
+    assert point_result["intersection_pct"].tolist() == [100, 100]
+
+
+def test_parse_kml_streams_placemarks_into_rows(tmp_path):
+    pytest.importorskip("lxml")
+    placemark = """
+      <Placemark>
+        <TimeSpan><begin>2026-06-28T18:0{i}:59Z</begin><end>2026-06-28T18:0{i}:59Z</end></TimeSpan>
+        <ExtendedData>
+          <Data name="Mode"><value>IW</value></Data>
+          <Data name="OrbitAbsolute"><value>{i}00</value></Data>
+          <Data name="OrbitRelative"><value>{i}</value></Data>
+        </ExtendedData>
+        <Polygon><outerBoundaryIs><LinearRing>
+          <coordinates>0,0,0 {i},0,0 {i},1,0 0,0,0</coordinates>
+        </LinearRing></outerBoundaryIs></Polygon>
+      </Placemark>
+    """
+    kml_path = tmp_path / "plan.kml"
+    kml_path.write_text(
+        '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+        + "".join(placemark.format(i=i) for i in (1, 2))
+        + "</Document></kml>",
+        encoding="utf-8",
+    )
+
+    gdf = utils_mod.parse_kml(kml_path)
+
+    assert list(gdf["orbit_relative"]) == [1, 2]
+    assert list(gdf["orbit_absolute"]) == [100, 200]
+    assert list(gdf["mode"]) == ["IW", "IW"]
+    assert gdf["begin_date"].iloc[1] == dt.datetime(2026, 6, 28, 18, 2, 59, tzinfo=dt.timezone.utc)
+    assert gdf.geometry.iloc[1].bounds == (0.0, 0.0, 2.0, 1.0)
@@ -23,7 +23,7 @@ hit_api_limit: bool = False
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "cloudiness-client/1.0"})
 
-adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
 SESSION.mount("https://", adapter)
 
 
@@ -63,23 +63,24 @@ def api_limit_reached() -> bool:
     return hit_api_limit
 
 
-def get_cloudiness(url):
+def get_cloudiness(url, session: requests.Session = SESSION):
     """Download a CLOUD*.tif file and calculate cloud pixel percentage."""
     cloud_values = {4, 5, 6, 7, 12, 13, 14, 15}
     exclude_values = {255}
 
     try:
         with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as tmp:
-            response = requests.get(url, stream=True)
-            if response.status_code != 200:
-                LOGGER.warning(
-                    "Failed to download %s (status %s)",
-                    url, response.status_code
-                )
-                return None
+            # Closing the streamed response hands the connection back to the pool
+            with session.get(url, stream=True) as response:
+                if response.status_code != 200:
+                    LOGGER.warning(
+                        "Failed to download %s (status %s)",
+                        url, response.status_code
+                    )
+                    return None
 
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp.write(chunk)
+                for chunk in response.iter_content(chunk_size=8192):
+                    tmp.write(chunk)
             tmp_path = tmp.name
 
         with rasterio.open(tmp_path) as src:
@@ -296,7 +297,7 @@ def get_cloudiness_at_points(
                 reason = error_info.get("reason", "Unknown 429 error")
             except Exception:
                 reason = e.response.text
-            LOGGER.warning(f"{reason}")
+            LOGGER.warning("%s", reason)
             return [None] * len(points)
         else:
             LOGGER.error("HTTP error calculating historical cloudiness using %s: %s", url, e)
@@ -575,6 +576,49 @@ def get_overpass_cloudiness(
         return None
 
 
+def _cloudiness_for_collect(
+    footprint: Polygon,
+    timestamps: List[datetime],
+    aoi_polygon: Polygon,
+    now: datetime,
+) -> List[Optional[float]]:
+    """Compute cloudiness for each timestamp of one collect footprint."""
+    # The AOI overlap is the same for every timestamp of a collect
+    intersection_geom = footprint.intersection(aoi_polygon)
+    if intersection_geom.is_empty:
+        return [None] * len(timestamps)
+
+    geojson_geom = mapping(intersection_geom)
+    four_days_later = now + timedelta(days=4)
+    fourteen_days_later = now + timedelta(days=14)
+
+    cloudiness_vals: List[Optional[float]] = []
+    for timestamp in timestamps:
+        n_samples = 210 if now <= timestamp <= four_days_later else 60
+
+        if timestamp <= fourteen_days_later:
+            try:
+                cloudiness = get_overpass_cloudiness(
+                    polygon_geojson=geojson_geom,
+                    target_datetime=timestamp,
+                    num_samples=n_samples,
+                    allow_nearest=True,
+                    sampling_method="grid",
+                )
+                cloudiness_vals.append(cloudiness)
+            except Exception as e:
+                LOGGER.warning(
+                    "Cloudiness prediction failed for %s: %s",
+                    timestamp,
+                    e,
+                )
+                cloudiness_vals.append(None)
+        else:
+            cloudiness_vals.append(None)
+
+    return cloudiness_vals
+
+
 def make_get_cloudiness_for_row(aoi_polygon: Polygon):
     """
     Return a function that computes cloudiness for each row in a GeoDataFrame.
@@ -586,43 +630,34 @@ def make_get_cloudiness_for_row(aoi_polygon: Polygon):
             row.begin_date if isinstance(
                 row.begin_date, list) else [row.begin_date]
         )
-        cloudiness_vals: List[Optional[float]] = []
-
-        for timestamp in timestamps:
-            now = datetime.now(timezone.utc)
-            four_days_later = now + timedelta(days=4)
-            fourteen_days_later = now + timedelta(days=14)
-
-            intersection_geom = row.geometry.intersection(aoi_polygon)
-
-            if intersection_geom.is_empty:
-                cloudiness_vals.append(None)
-                continue
+        return _cloudiness_for_collect(
+            row.geometry, timestamps, aoi_polygon, datetime.now(timezone.utc)
+        )
 
-            geojson_geom = mapping(intersection_geom)
+    return get_cloudiness_for_row
 
-            n_samples = 210 if now <= timestamp <= four_days_later else 60
 
-            if timestamp <= fourteen_days_later:
-                try:
-                    cloudiness = get_overpass_cloudiness(
-                        polygon_geojson=geojson_geom,
-                        target_datetime=timestamp,
-                        num_samples=n_samples,
-                        allow_nearest=True,
-                        sampling_method="grid",
-                    )
-                    cloudiness_vals.append(cloudiness)
-                except Exception as e:
-                    LOGGER.warning(
-                        "Cloudiness prediction failed for %s: %s",
-                        timestamp,
-                        e,
-                    )
-                    cloudiness_vals.append(None)
-            else:
-                cloudiness_vals.append(None)
+def make_get_cloudiness_batch(aoi_polygon: Polygon):
+    """
+    Return a function that computes cloudiness for many collects at once.
 
-        return cloudiness_vals
+    The returned callable takes parallel sequences of footprints and
+    timestamp lists and returns one list of cloudiness values per collect.
+    Collects are processed in turn: each cloudiness query already fans
+    out over a rate-limited thread pool, so running collects concurrently
+    would only hit the weather API limit sooner.
+    """
 
-    return get_cloudiness_for_row
+    def get_cloudiness_batch(geometries, date_lists) -> List[List[Optional[float]]]:
+        now = datetime.now(timezone.utc)
+        return [
+            _cloudiness_for_collect(
+                footprint,
+                dates if isinstance(dates, list) else [dates],
+                aoi_polygon,
+                now,
+            )
+            for footprint, dates in zip(geometries, date_lists)
+        ]
+
+    return get_cloudiness_batch
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List
@@ -10,6 +11,29 @@ from utils.utils import download_kml, parse_kml
 
 SCRATCH_DIR = Path.cwd() / "scratch"
 
+# Plan downloads and KML parsing are I/O bound; overlap a few at a time
+MAX_WORKERS = 8
+
+# Parsed plans are cached as FlatGeobuf: binary, and read back much faster
+# than GeoJSON text through the same gpd.read_file call
+COLLECTION_DRIVER = "FlatGeobuf"
+COLLECTION_SUFFIX = ".fgb"
+# FlatGeobuf's packed spatial index reorders features on write; without it
+# rows read back in the order they were written (begin_date order)
+COLLECTION_WRITE_OPTIONS = {"SPATIAL_INDEX": "NO"}
+
+# Low-cardinality plan columns, held as categoricals so grouping and
+# filtering compare small integer codes
+CATEGORY_COLUMNS = ("mode", "orbit_relative", "platform")
+
+
+def _categorize(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Cast the plan's low-cardinality columns to categoricals."""
+    for column in CATEGORY_COLUMNS:
+        if column in gdf.columns:
+            gdf[column] = gdf[column].astype("category")
+    return gdf
+
 
 def sync_scratch_directory(
     urls: List[str],
@@ -52,22 +76,58 @@ def sync_scratch_directory(
         except Exception as e:
             logger.error("Failed to delete %s: %s", file_path, e)
 
-    # Download missing files
-    local_kml_paths: List[Path] = []
-    for url in urls:
-        filename = f"{mission_name}_{Path(url).stem}.kml"
-        file_path = scratch_dir / filename
+    # Local path for every URL, in URL order
+    url_paths = [
+        (url, scratch_dir / f"{mission_name}_{Path(url).stem}.kml") for url in urls
+    ]
 
+    # One download per missing path, so no two workers write the same file
+    to_download: dict[Path, str] = {}
+    for url, file_path in url_paths:
         if file_path.name in missing_files or not file_path.exists():
-            try:
-                download_kml(url, str(file_path))
-            except Exception as e:
-                logger.error("Failed downloading %s: %s", url, e)
-                continue
+            to_download.setdefault(file_path, url)
+
+    def _download(item) -> Path | None:
+        file_path, url = item
+        try:
+            download_kml(url, str(file_path))
+        except Exception as e:
+            logger.error("Failed downloading %s: %s", url, e)
+            return file_path
+        return None
+
+    # Download missing files concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        failed = {
+            path for path in executor.map(_download, to_download.items()) if path
+        }
+
+    return [file_path for _, file_path in url_paths if file_path not in failed]
 
-        local_kml_paths.append(file_path)
 
-    return local_kml_paths
+def _load_collection(kml_path: Path, scratch_dir: Path, logger: logging.Logger):
+    """Read the cached collection for a KML plan, parsing the KML on a miss."""
+    collection_path = scratch_dir / f"{kml_path.stem}{COLLECTION_SUFFIX}"
+
+    if collection_path.exists():
+        logger.info("Using cached file: %s", collection_path)
+        try:
+            return gpd.read_file(collection_path)
+        except Exception as e:
+            logger.error("Failed reading %s: %s", collection_path, e)
+            return None
+
+    logger.info("Parsing new file: %s", kml_path)
+    try:
+        gdf = parse_kml(kml_path)
+        if gdf.empty:
+            logger.warning("No valid data in file: %s", kml_path)
+            return None
+        gdf.to_file(collection_path, driver=COLLECTION_DRIVER, **COLLECTION_WRITE_OPTIONS)
+    except Exception as e:
+        logger.error("Failed parsing %s: %s", kml_path, e)
+        return None
+    return gdf
 
 
 def build_sentinel_collection(
@@ -77,18 +137,19 @@ def build_sentinel_collection(
     out_filename: str,
     logger: logging.Logger,
     platforms: list | None = None,
-) -> Path:
+) -> tuple[Path, gpd.GeoDataFrame | None]:
     """
-    Download, parse, and merge Sentinel acquisition plans into a GeoJSON file.
+    Download, parse, and merge Sentinel acquisition plans into a FlatGeobuf file.
 
     Args:
         urls (List[str]): List of ESA download URLs.
         mission_name (str): Name prefix for output filenames.
-        out_filename (str): Final GeoJSON output filename.
+        out_filename (str): Final FlatGeobuf output filename.
         logger (logging.Logger): Logger object for status reporting.
 
     Returns:
-        Path: Path to the generated GeoJSON file.
+        tuple[Path, GeoDataFrame | None]: Path to the generated collection
+        file and the merged collection, or (Path(), None) on failure.
     """
     out_path = SCRATCH_DIR / out_filename
     SCRATCH_DIR.mkdir(exist_ok=True)
@@ -101,10 +162,25 @@ def build_sentinel_collection(
     if platforms:
         platform_by_name = {Path(u).stem.lower(): p for u, p in zip(urls, platforms)}
 
+    # Read/parse every distinct plan concurrently
+    unique_paths = list(dict.fromkeys(local_kml_paths))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        loaded = dict(
+            zip(
+                unique_paths,
+                executor.map(
+                    lambda path: _load_collection(path, SCRATCH_DIR, logger),
+                    unique_paths,
+                ),
+            )
+        )
+
     gdfs: list[gpd.GeoDataFrame] = []
 
     for kml_path in local_kml_paths:
-        collection_path = SCRATCH_DIR / f"{kml_path.stem}.geojson"
+        gdf = loaded[kml_path]
+        if gdf is None:
+            continue
         platform = None
 
         if platform_by_name:
@@ -124,32 +200,12 @@ def build_sentinel_collection(
                         platform = value
                         break
 
-        if collection_path.exists():
-            logger.info("Using cached file: %s", collection_path)
-            try:
-                gdf = gpd.read_file(collection_path)
-            except Exception as e:
-                logger.error("Failed reading %s: %s", collection_path, e)
-                continue
-        else:
-            logger.info("Parsing new file: %s", kml_path)
-            try:
-                gdf = parse_kml(kml_path)
-                if not gdf.empty:
-                    gdf.to_file(collection_path)
-                else:
-                    logger.warning("No valid data in file: %s", kml_path)
-                    continue
-            except Exception as e:
-                logger.error("Failed parsing %s: %s", kml_path, e)
-                continue
-
         gdf["platform"] = platform
         gdfs.append(gdf)
 
     if not gdfs:
         logger.error("No valid GeoDataFrames created.")
-        return Path()
+        return Path(), None
 
     n_days_earlier = datetime.now(timezone.utc) - timedelta(days=n_day_past)
 
@@ -158,11 +214,17 @@ def build_sentinel_collection(
     full_gdf["end_date"] = pd.to_datetime(full_gdf["end_date"], utc=True)
     full_gdf = full_gdf.loc[full_gdf["begin_date"] >= n_days_earlier]
     full_gdf = full_gdf.sort_values("begin_date").reset_index(drop=True)
+    full_gdf = _categorize(full_gdf)
     try:
-        full_gdf.to_file(out_path)
+        full_gdf.to_file(out_path, driver=COLLECTION_DRIVER, **COLLECTION_WRITE_OPTIONS)
         logger.info("%s collection saved to: %s", mission_name, out_path)
     except Exception as e:
         logger.error("Failed to write final output file: %s", e)
-        return Path()
+        return Path(), None
+
+    return out_path, full_gdf
+
 
-    return out_path
+def read_collection(path) -> gpd.GeoDataFrame:
+    """Load a collection file written by build_sentinel_collection."""
+    return _categorize(gpd.read_file(path))
@@ -2,7 +2,7 @@ import json
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
 import requests
 from shapely.geometry import Point, Polygon
@@ -104,11 +104,10 @@ class LandsatScheduleSource:
 
 def format_date_lines(date_strings: list[str], per_line: int = 5) -> str:
     """Wrap Landsat pass dates across multiple lines."""
-    from datetime import timezone
-
+    now = datetime.now(timezone.utc)
     formatted_dates = [
         date_str
-        + (" (P)" if datetime.strptime(date_str, DATE_FORMAT).replace(tzinfo=timezone.utc) < datetime.now(timezone.utc) else "")
+        + (" (P)" if datetime.strptime(date_str, DATE_FORMAT).replace(tzinfo=timezone.utc) < now else "")
         for date_str in date_strings
     ]
     return "\n".join(
@@ -81,7 +81,7 @@ def estimate_nisar_overpass_time(date_str: str, lat: float, lon: float, pass_dir
         local_solar_hour = NISAR_DESCENDING_CROSSING_HOUR
     else:
         # Unknown direction - default to descending (most common for SAR)
-        LOGGER.warning(f"Unknown pass direction '{pass_direction}', assuming Descending")
+        LOGGER.warning("Unknown pass direction '%s', assuming Descending", pass_direction)
         local_solar_hour = NISAR_DESCENDING_CROSSING_HOUR
 
     # Local Solar Time (LST) approximation:
@@ -232,25 +232,42 @@ def create_nisar_collection_plan() -> Path:
     return out_path
 
 
+def _format_pass_dates(date_values) -> tuple[list, list[list[str]]]:
+    """
+    Format every row's acquisition dates in one vectorized pass.
+
+    Returns the first pass time (HH:MM, None for rows without dates) and
+    the per-row list of dates with the past marker.
+    """
+    date_lists = [v if isinstance(v, list) else [v] for v in date_values]
+    stamps = pd.to_datetime(pd.Series(date_lists, dtype=object).explode(), utc=True)
+    text = stamps.dt.strftime("%Y-%m-%d")
+    text = text.where(stamps >= pd.Timestamp.now(tz="UTC"), text + " (P)")
+
+    dates_by_row = text.dropna().groupby(level=0).agg(list).to_dict()
+    first_by_row = stamps.dropna().dt.strftime("%H:%M").groupby(level=0).first().to_dict()
+
+    positions = range(len(date_lists))
+    return (
+        [first_by_row.get(i) for i in positions],
+        [dates_by_row.get(i, []) for i in positions],
+    )
+
+
 def format_collects(gdf: gpd.GeoDataFrame) -> str:
     """Format NISAR collects for CLI output."""
     gdf_sorted = gdf.sort_values("intersection_pct", ascending=False).reset_index(drop=True)
     has_tide = "tide" in gdf_sorted.columns
     table = []
+    first_times, formatted_rows = _format_pass_dates(gdf_sorted["begin_date"])
 
-    for index, row in gdf_sorted.iterrows():
-        dates = row.begin_date if isinstance(row.begin_date, list) else [row.begin_date]
-
+    for row, first_time, formatted_dates in zip(
+        gdf_sorted.itertuples(), first_times, formatted_rows
+    ):
         # For NISAR, all dates in same track/direction have same time (local solar time)
         # Show time in Direction column, dates only in separate column (more compact)
-        if dates:
-            first_time = dates[0].strftime("%H:%M")
+        if formatted_dates:
             direction_with_time = f"{row.pass_direction} (~{first_time} UTC ±20-40 min)"
-            formatted_dates = [
-                stamp.strftime("%Y-%m-%d")
-                + (" (P)" if stamp < datetime.now(timezone.utc) else "")
-                for stamp in dates
-            ]
             date_lines = [
                 ", ".join(formatted_dates[i:i + 5])
                 for i in range(0, len(formatted_dates), 5)
@@ -261,7 +278,7 @@ def format_collects(gdf: gpd.GeoDataFrame) -> str:
             dates_str = "N/A"
 
         base_row = [
-            index + 1,
+            row.Index + 1,
             direction_with_time,
             row.track,
             row.frame,
@@ -301,18 +318,14 @@ def build_collect_summaries(gdf: gpd.GeoDataFrame) -> list[str]:
     summaries: list[str] = []
     has_tide = "tide" in gdf.columns
 
-    for _, row in gdf.iterrows():
-        dates = row.begin_date if isinstance(row.begin_date, list) else [row.begin_date]
+    first_times, formatted_rows = _format_pass_dates(gdf["begin_date"])
 
+    for row, first_time, formatted_dates in zip(
+        gdf.itertuples(), first_times, formatted_rows
+    ):
         # For NISAR, all dates in same track/direction have same time
         # Show time with direction, dates only in separate section
-        if dates:
-            first_time = dates[0].strftime("%H:%M")
-            formatted_dates = [
-                stamp.strftime("%Y-%m-%d")
-                + (" (P)" if stamp < datetime.now(timezone.utc) else "")
-                for stamp in dates
-            ]
+        if formatted_dates:
             date_display = ", ".join(formatted_dates)
         else:
             first_time = "N/A"
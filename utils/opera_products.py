@@ -1,19 +1,126 @@
 import logging
+import random
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
 import leafmap
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 
 from utils.cloudiness import get_cloudiness
-from utils.utils import bbox_to_geometry, bbox_type
+from utils.utils import bbox_to_geometry, bbox_type, extract_umm_fields
 
 LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for missing UMM sections
+_EMPTY = MappingProxyType({})
+
+# OPERA collections searched when no product list is given
+DEFAULT_DATASETS = (
+    "OPERA_L3_DSWX-HLS_V1",
+    "OPERA_L3_DSWX-S1_V1",
+    "OPERA_L3_DIST-ALERT-HLS_V1",
+    "OPERA_L3_DIST-ANN-HLS_V1",
+    "OPERA_L2_RTC-S1_V1",
+    "OPERA_L2_CSLC-S1_V1",
+    "OPERA_L3_DISP-S1_V1",
+)
+
+# Granule file-name keyword -> layer slot used in the export
+KEYWORD_MAP = MappingProxyType(
+    {
+        "B01_WTR": "water",
+        "BWTR": "bwater",
+        "B03_CONF": "water_conf",
+        "VEG-ANOM-MAX": "veg_anom_max",
+        "VEG-DIST-STATUS": "veg_dist_status",
+        "VEG-DIST-DATE": "veg_dist_date",
+        "VEG-DIST-CONF": "veg_dist_conf",
+        "_30_v1.0_VV": "rtc-vv",
+        "_30_v1.0_VH": "rtc-vh",
+        "_VV_v1.1": "cslc-vv",
+        "CLOUD": "cloud",
+    }
+)
+_KEYWORD_PATTERN = re.compile(
+    "(" + "|".join(re.escape(keyword) for keyword in KEYWORD_MAP) + ")"
+)
+
+# Cloud statistics of recently processed CLOUD layers, keyed by URL and
+# evicted least-recently-used beyond _CLOUDINESS_CACHE_SIZE entries. Failed
+# downloads are not stored so they are retried by the next export.
+_CLOUDINESS_CACHE_SIZE = 256
+_CLOUDINESS_CACHE: OrderedDict[str, tuple[float, float]] = OrderedDict()
+_CLOUDINESS_LOCK = threading.Lock()
+
+
+def _cached_cloudiness(url: str):
+    """Return get_cloudiness(url), reusing earlier successful results."""
+    with _CLOUDINESS_LOCK:
+        result = _CLOUDINESS_CACHE.get(url)
+        if result is not None:
+            _CLOUDINESS_CACHE.move_to_end(url)
+            return result
+
+    # Download outside the lock so the export's workers run concurrently
+    result = get_cloudiness(url)
+    if result is not None:
+        with _CLOUDINESS_LOCK:
+            _CLOUDINESS_CACHE[url] = result
+            _CLOUDINESS_CACHE.move_to_end(url)
+            while len(_CLOUDINESS_CACHE) > _CLOUDINESS_CACHE_SIZE:
+                _CLOUDINESS_CACHE.popitem(last=False)
+    return result
+
+
+def _is_transient(error: BaseException) -> bool:
+    """
+    Tell whether a failed search is worth retrying.
+
+    Walks the exception chain (earthaccess re-raises HTTP errors) for an
+    HTTP response; client errors other than 429 are permanent, everything
+    else (5xx, 429, connection problems) is retried.
+    """
+    while error is not None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        error = error.__cause__ or error.__context__
+    return True
+
+
+# Flattened CMR columns with only a handful of distinct values per search
+_CATEGORY_COLUMNS = ("ShortName", "DayNightFlag", "PGEName", "PGEVersion")
+
+
+def _shrink(gdf):
+    """
+    Reduce the memory footprint of a GeoDataFrame kept in the results.
+
+    Known low-cardinality CMR columns become categories and numeric
+    columns are downcast; every column is kept.
+    """
+    for column in _CATEGORY_COLUMNS:
+        if column in gdf.columns:
+            gdf[column] = gdf[column].astype("category")
+    for column in gdf.select_dtypes("integer"):
+        gdf[column] = pd.to_numeric(gdf[column], downcast="integer")
+    for column in gdf.select_dtypes("floating"):
+        gdf[column] = pd.to_numeric(gdf[column], downcast="float")
+
+    return gdf
+
 
 def find_print_available_opera_products(
     bbox,
@@ -55,15 +162,7 @@ def find_print_available_opera_products(
             for item in list_of_products
         ]
     else:
-        opera_datasets = [
-            "OPERA_L3_DSWX-HLS_V1",
-            "OPERA_L3_DSWX-S1_V1",
-            "OPERA_L3_DIST-ALERT-HLS_V1",
-            "OPERA_L3_DIST-ANN-HLS_V1",
-            "OPERA_L2_RTC-S1_V1",
-            "OPERA_L2_CSLC-S1_V1",
-            "OPERA_L3_DISP-S1_V1",
-        ]
+        opera_datasets = DEFAULT_DATASETS
 
     # Parse the bbox argument
     bbox_parsed = bbox_type(bbox)
@@ -100,74 +199,91 @@ def find_print_available_opera_products(
         start_date_recent = f"{one_year_ago:%Y-%m-%d}T00:00:00"
         end_date_recent = f"{today:%Y-%m-%d}T23:59:59"
 
-    results_dict: dict = {}
     LOGGER.info("** Available OPERA Products for Selected AOI **")
-    for dataset in opera_datasets:
-        LOGGER.info("* Searching %s ...", dataset)
-
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
-            try:
-                results, gdf = leafmap.nasa_data_search(
-                    short_name=dataset,
-                    cloud_hosted=True,
-                    bounding_box=aoi,
-                    temporal=(start_date_recent, end_date_recent),
-                    return_gdf=True,
-                )
+    LOGGER.info("* Searching %s ...", ", ".join(opera_datasets))
 
-                if gdf is not None and not gdf.empty:
-                    gdf = gdf.copy()
-                    gdf["original_index"] = gdf.index
-                    gdf["BeginningDateTime"] = pd.to_datetime(
-                        gdf["BeginningDateTime"],
-                    )
-
-                    # If a strict range was requested, we keep everything the API returned
-                    if is_range:
-                        pass
-                    # Otherwise, apply the standard 'number_of_dates' slice
-                    else:
-                        # Extract unique acquisition dates
-                        gdf["AcqDate"] = gdf["BeginningDateTime"].dt.date
-                        unique_dates = gdf.sort_values(
-                            "BeginningDateTime", ascending=False
-                        )["AcqDate"].unique()
-                        selected_dates = unique_dates[:number_of_dates]
-
-                        # Keep all granules that match selected dates
-                        gdf = gdf[gdf["AcqDate"].isin(selected_dates)]
-                        gdf = gdf.drop(columns=["AcqDate"])
-
-                    # Final formatting
-                    gdf["BeginningDateTime"] = gdf["BeginningDateTime"].dt.strftime(
-                        "%Y-%m-%dT%H:%M:%SZ",
-                    )
-                    results = [results[k] for k in gdf["original_index"]]
-                    gdf = gdf.drop(columns=["original_index"])
-                    LOGGER.info(
-                        "-> Success: %s → %d granule(s) saved.", dataset, len(gdf)
-                    )
-                    results_dict[dataset] = {
-                        "results": results,
-                        "gdf": gdf,
-                    }
-                    break
-                else:
-                    LOGGER.info("xxx Attempt %d: No granules for %s.", attempt, dataset)
-            except Exception as e:  # noqa: BLE001
-                LOGGER.info(
-                    "xxx Attempt %d: Error fetching %s: %s", attempt, dataset, e
-                )
+    # All collections share the same AOI and time window, so a single
+    # multi-collection CMR search replaces one round trip per dataset.
+    all_results, all_gdf = [], None
+    max_attempts = 3
+    for attempt in range(1, max_attempts + 1):
+        try:
+            all_results, all_gdf = leafmap.nasa_data_search(
+                short_name=list(opera_datasets),
+                cloud_hosted=True,
+                bounding_box=aoi,
+                temporal=(start_date_recent, end_date_recent),
+                return_gdf=True,
+            )
+            if all_gdf is not None and not all_gdf.empty:
+                break
+            LOGGER.info("xxx Attempt %d: No granules found.", attempt)
+        except Exception as e:  # noqa: BLE001
+            LOGGER.info("xxx Attempt %d: Error fetching granules: %s", attempt, e)
+            if not _is_transient(e):
+                LOGGER.info("-> CMR rejected the search; not retrying.")
+                return {}
+
+        if attempt < max_attempts:
+            # Capped exponential backoff with jitter so concurrent callers
+            # do not retry against CMR in lockstep
+            time.sleep(min(30, 2**attempt) + random.random())
+        else:
+            LOGGER.info(
+                "-> Failed to fetch granules after %d attempts.",
+                max_attempts,
+            )
+            return {}
+
+    # Partition the combined results by collection. CMR matches short names
+    # case-insensitively, so compare upper-cased names on both sides.
+    collections = np.array(
+        [
+            item.get("umm", _EMPTY)
+            .get("CollectionReference", _EMPTY)
+            .get("ShortName")
+            for item in all_results
+        ],
+        dtype=object,
+    )
+    collection_keys = np.array(
+        [(name or "").upper() for name in collections], dtype=object
+    )
+    # CMR timestamps are UTC ISO-8601 strings, so they sort chronologically
+    # as text and their first 10 characters are the acquisition date
+    begin_times = all_gdf["BeginningDateTime"].to_numpy(dtype=str)
 
-            if attempt < max_attempts:
-                time.sleep(2**attempt)
-            else:
-                LOGGER.info(
-                    "-> Failed to fetch %s after %d attempts.",
-                    dataset,
-                    max_attempts,
-                )
+    results_dict: dict = {}
+    for dataset in opera_datasets:
+        positions = np.flatnonzero(collection_keys == dataset.upper())
+        if not positions.size:
+            LOGGER.info("xxx No granules for %s.", dataset)
+            continue
+
+        bdt = begin_times[positions]
+
+        # If a strict range was requested, we keep everything the API returned
+        # Otherwise, keep all granules of the 'number_of_dates' latest dates
+        if not is_range:
+            acq_dates = bdt.astype("U10")
+            order = np.argsort(bdt, kind="stable")[::-1]
+            selected_dates = pd.unique(acq_dates[order])[:number_of_dates]
+            keep = np.isin(acq_dates, selected_dates)
+            positions, bdt = positions[keep], bdt[keep]
+
+        # Drop fractional seconds: YYYY-MM-DDTHH:MM:SSZ
+        gdf = _shrink(
+            all_gdf.iloc[positions].assign(
+                BeginningDateTime=np.char.add(bdt.astype("U19"), "Z"),
+            )
+        )
+        results = [all_results[k] for k in positions]
+        LOGGER.info("-> Success: %s → %d granule(s) saved.", dataset, len(gdf))
+        # Key on the canonical ShortName CMR returned
+        results_dict[collections[positions[0]]] = {
+            "results": results,
+            "gdf": gdf,
+        }
 
     return results_dict
 
@@ -187,6 +303,59 @@ def describe_cloud_cover(cover_percent: float) -> str:
     )
 
 
+def classify_granule_urls(umms: list[dict]) -> list[dict[str, str]]:
+    """
+    Map each OPERA layer slot to its download URL for a batch of granules.
+
+    All granule URLs are flattened into one pandas Series so the
+    HTTPS/extension filter runs vectorized, and every keyword is found
+    in a single pass of one compiled alternation regex per URL.
+
+    Parameters
+    ----------
+    umms : list[dict]
+        The "umm" metadata blocks of CMR granules.
+
+    Returns
+    -------
+    list[dict]
+        One dict per granule: slot name -> HTTPS URL of the first
+        matching .tif/.h5 layer, or "N/A".
+    """
+    granule_urls = [dict.fromkeys(KEYWORD_MAP.values(), "N/A") for _ in umms]
+
+    granule_idx = []
+    all_urls = []
+    for idx, umm in enumerate(umms):
+        for url_entry in umm.get("RelatedUrls", []):
+            granule_idx.append(idx)
+            all_urls.append(url_entry.get("URL", ""))
+    if not all_urls:
+        return granule_urls
+
+    urls = pd.Series(all_urls, dtype=object)
+    mask = urls.str.startswith("https://") & urls.str.endswith((".tif", ".h5"))
+    urls = urls[mask]
+
+    # One regex pass per URL finds every keyword it contains
+    found = urls.str.extractall(_KEYWORD_PATTERN)[0]
+    rows = found.index.get_level_values(0)
+    hits = pd.DataFrame(
+        {
+            "granule": [granule_idx[row] for row in rows],
+            "key": found.map(KEYWORD_MAP).to_numpy(),
+            "url": urls.loc[rows].to_numpy(),
+        }
+    )
+
+    # Each slot keeps the first matching URL of its granule
+    hits = hits.drop_duplicates(["granule", "key"])
+    for idx, key, url in hits.itertuples(index=False):
+        granule_urls[idx][key] = url
+
+    return granule_urls
+
+
 def export_opera_products(results_dict: dict, timestamp_dir, result_s1=None, compute_cloudiness: bool = True) -> None:
     """
     Export OPERA products to an Excel file and log cloudiness summary.
@@ -203,12 +372,7 @@ def export_opera_products(results_dict: dict, timestamp_dir, result_s1=None, com
         Whether to compute cloudiness from CLOUD layers. Set to False to skip and save time.
     """
     output_file = timestamp_dir / "opera_products_metadata.xlsx"
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "OPERA Metadata"
 
-    # Define bold font for header
-    bold_font = Font(bold=True)
     headers = [
         "Dataset",
         "Granule ID",
@@ -227,17 +391,35 @@ def export_opera_products(results_dict: dict, timestamp_dir, result_s1=None, com
         "Download URL CSLC-VV",
         "Geometry (WKT)",
     ]
-    ws.append(headers)
-
-    # Apply bold to header cells
-    for cell in ws[1]:
-        cell.font = bold_font
-
-    # Freeze header row (so row 1 stays visible when scrolling)
-    ws.freeze_panes = "A2"
+    rows: list[list] = []
 
     cover_description: str | None = None
 
+    granule_urls = {
+        dataset: classify_granule_urls(
+            [item.get("umm", _EMPTY) for item in data.get("results", [])]
+        )
+        for dataset, data in results_dict.items()
+    }
+
+    # Cloud layers are remote raster reads; fetch them concurrently
+    # up front instead of one at a time while writing rows.
+    cloud_results: dict = {}
+    if compute_cloudiness:
+        cloud_urls = list(
+            dict.fromkeys(
+                urls["cloud"]
+                for dataset_urls in granule_urls.values()
+                for urls in dataset_urls
+                if urls["cloud"] != "N/A"
+            )
+        )
+        if cloud_urls:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                cloud_results = dict(
+                    zip(cloud_urls, executor.map(_cached_cloudiness, cloud_urls))
+                )
+
     for dataset, data in results_dict.items():
         results = data.get("results", [])
         gdf = data.get("gdf")
@@ -247,82 +429,36 @@ def export_opera_products(results_dict: dict, timestamp_dir, result_s1=None, com
                 "Skipping geometry for dataset %s: No valid GeoDataFrame.",
                 dataset,
             )
-            geometries = [None] * len(results)
+            wkts = ["N/A"] * len(results)
         else:
-            geometries = list(gdf.geometry)
+            # Vectorized WKT conversion; full precision like geom.wkt
+            wkts = gdf.geometry.to_wkt(rounding_precision=-1).fillna("N/A").tolist()
 
         overall_cloudy_area = 0.0
         overall_area = 0.0
 
         for idx, item in enumerate(results):
-            umm = item.get("umm", {})
-            granule_id = umm.get("GranuleUR", "N/A")
-            temporal = umm.get("TemporalExtent", {})
-            start_time = temporal.get("RangeDateTime", {}).get(
-                "BeginningDateTime",
-                "N/A",
-            )
-            end_time = temporal.get("RangeDateTime", {}).get(
-                "EndingDateTime",
-                "N/A",
+            granule_id, start_time, end_time, _ = extract_umm_fields(
+                item.get("umm", _EMPTY)
             )
 
-            urls = {
-                "water": "N/A",
-                "bwater": "N/A",
-                "water_conf": "N/A",
-                "veg_anom_max": "N/A",
-                "veg_dist_status": "N/A",
-                "veg_dist_date": "N/A",
-                "veg_dist_conf": "N/A",
-                "rtc-vv": "N/A",
-                "rtc-vh": "N/A",
-                "cslc-vv": "N/A",
-                "cloud": "N/A",
-            }
-
-            keyword_map = {
-                "B01_WTR": "water",
-                "BWTR": "bwater",
-                "B03_CONF": "water_conf",
-                "VEG-ANOM-MAX": "veg_anom_max",
-                "VEG-DIST-STATUS": "veg_dist_status",
-                "VEG-DIST-DATE": "veg_dist_date",
-                "VEG-DIST-CONF": "veg_dist_conf",
-                "_30_v1.0_VV": "rtc-vv",
-                "_30_v1.0_VH": "rtc-vh",
-                "_VV_v1.1": "cslc-vv",
-                "CLOUD": "cloud",
-            }
-
-            related_urls = umm.get("RelatedUrls", [])
-            for url_entry in related_urls:
-                url = url_entry.get("URL", "")
-                if not url.startswith("https://"):
-                    continue
-                if not (url.endswith(".tif") or url.endswith(".h5")):
-                    continue
-                for keyword, key in keyword_map.items():
-                    if keyword in url:
-                        urls[key] = url
+            urls = granule_urls[dataset][idx]
 
             # add geometry if available
-            geom = geometries[idx] if idx < len(geometries) else None
-            geom_wkt = geom.wkt if geom is not None else "N/A"
+            geom_wkt = wkts[idx] if idx < len(wkts) else "N/A"
 
             cloud_layer_url = urls["cloud"]
             cloud_cover_percent: float | str = "N/A"
             area = 0.0
 
             if compute_cloudiness and cloud_layer_url and cloud_layer_url != "N/A":
-                result = get_cloudiness(cloud_layer_url)
+                result = cloud_results.get(cloud_layer_url)
                 if result is not None:
                     cloud_cover_percent, area = result
                     overall_cloudy_area += area * cloud_cover_percent / 100.0
                     overall_area += area
 
-            # Write data row
-            ws.append(
+            rows.append(
                 [
                     dataset,
                     granule_id,
@@ -347,14 +483,36 @@ def export_opera_products(results_dict: dict, timestamp_dir, result_s1=None, com
             overall_cloud_cover_percent = 100.0 * (overall_cloudy_area / overall_area)
             cover_description = describe_cloud_cover(overall_cloud_cover_percent)
 
+    # Stream all rows into a write-only workbook. Column widths must be
+    # set before the first row is written, so compute them from the rows.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("OPERA Metadata")
+
+    # Freeze header row (so row 1 stays visible when scrolling)
+    ws.freeze_panes = "A2"
+
     # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = max(len(str(cell.value or "")) for cell in column)
+    for col_idx, column in enumerate(zip(headers, *rows), start=1):
+        max_length = max(len(str(value or "")) for value in column)
         adjusted_width = min(max_length + 2, 100)  # cap width when needed
-        ws.column_dimensions[column[0].column_letter].width = adjusted_width
+        ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+
+    # Bold header row
+    bold_font = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = bold_font
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in rows:
+        ws.append(row)
 
-    # Save workbook
-    wb.save(output_file)
+    # Save workbook through a large write buffer; the zip writer otherwise
+    # issues many small writes for the compressed sheet parts
+    with open(output_file, "wb", buffering=1 << 20) as handle:
+        wb.save(handle)
 
     LOGGER.info("-> OPERA products metadata successfully saved to %s", output_file)
     if cover_description:
@@ -1,73 +1,318 @@
-import colorsys
-import json
 import logging
-import random
 import re
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Dict
 
 import folium
-import geopandas as gpd
 import matplotlib.pyplot as plt
+import numpy as np
+import shapely
 from branca.element import MacroElement
 from jinja2 import Template
 from matplotlib.colors import to_hex
-from shapely.geometry import Polygon
+from shapely.geometry import Polygon, mapping
 
 
 from utils.utils import (
     bbox_type,
     bbox_to_geometry,
+    build_overpass_index,
     check_opera_overpass_intersection,
+    extract_umm_fields,
     style_function_factory,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+# Patterns used on every overpass info line
+_RE_NONZERO_DIGIT = re.compile(r"[1-9]")
+_RE_ASCENDING = re.compile(r"ascending", re.IGNORECASE)
+_RE_DESCENDING = re.compile(r"descending", re.IGNORECASE)
 
+# Golden-angle hue stepping for hsl_distinct_colors_improved
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+_HUE_OFFSET = 0.12
+
+
+@lru_cache(maxsize=1)
+def _tab20_colors() -> tuple[str, ...]:
+    """Return the 20 matplotlib tab20 colors as hex strings."""
+    cmap = plt.get_cmap("tab20")
+    return tuple(to_hex(cmap(i)) for i in range(20))
+
+
+# Outline style shared by every AOI layer
+_AOI_STYLE = {"color": "black", "weight": 2, "fillOpacity": 0.0}
+
+
+def _aoi_style(feature) -> dict:
+    return _AOI_STYLE
+
+
+@lru_cache(maxsize=64)
+def _make_style_fn(color: str, fill_opacity: float = 0.5, fill: bool = True):
+    """Return one reusable style callable per color for fixed-style layers."""
+    style = {"color": color}
+    if fill:
+        style["fillColor"] = color
+    style.update(weight=2, fillOpacity=fill_opacity)
+    return lambda feature, style=style: style
+
+
+def _parse_compact_utc(stamp: str) -> datetime:
+    """Parse a ``YYYYMMDDTHHMMSSZ`` granule stamp by slicing fixed offsets."""
+    if len(stamp) != 16 or stamp[8] != "T" or stamp[15] != "Z":
+        raise ValueError(f"Unexpected acquisition stamp: {stamp!r}")
+    return datetime(
+        int(stamp[0:4]),
+        int(stamp[4:6]),
+        int(stamp[6:8]),
+        int(stamp[9:11]),
+        int(stamp[11:13]),
+        int(stamp[13:15]),
+        tzinfo=timezone.utc,
+    )
+
+
+def _save_map(map_object, output_file: Path, chunk_size: int = 1 << 20) -> None:
+    """Write the rendered map in slices instead of one full encoded copy."""
+    html = map_object.get_root().render()
+    with open(output_file, "w", encoding="utf-8", newline="", buffering=chunk_size) as handle:
+        for start in range(0, len(html), chunk_size):
+            handle.write(html[start:start + chunk_size])
+
+
+def _resolve_aoi(bbox: Any, timestamp_dir: Path):
+    """Parse the bbox argument once into the AOI polygon and its centroid."""
+    aoi_polygon, _, centroid = bbox_to_geometry(bbox_type(bbox), timestamp_dir)
+    return aoi_polygon, centroid
+
+
+def _aoi_geojson(aoi_polygon) -> dict:
+    """Wrap the AOI polygon in a one-feature GeoJSON FeatureCollection."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": mapping(aoi_polygon), "properties": {}}
+        ],
+    }
+
+
+def _add_marker_layer(
+    parent,
+    lats,
+    lons,
+    popups: list[str],
+    icon,
+    max_width: int,
+) -> None:
+    """
+    Add many markers as a single GeoJSON point layer.
+
+    Every marker shares one icon and carries its popup HTML as a feature
+    property, so folium renders one layer instead of one element per granule.
+    """
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [float(lon), float(lat)]},
+            "properties": {"popup": popup},
+        }
+        for lat, lon, popup in zip(lats, lons, popups)
+    ]
+    if not features:
+        return
+
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        marker=folium.Marker(icon=icon),
+        popup=folium.GeoJsonPopup(
+            fields=["popup"],
+            labels=False,
+            localize=False,
+            max_width=max_width,
+        ),
+    ).add_to(parent)
+
+
+def _swath_style(feature) -> dict:
+    return _make_style_fn(feature["properties"]["color"], 0.3, fill=False)(feature)
+
+
+def _add_swath_layer(parent, swaths: list[tuple], name: str) -> None:
+    """
+    Add overpass swaths as one styled GeoJSON layer.
+
+    Each swath is a ``(polygon, color, popup_html)`` tuple; the color and
+    popup travel as feature properties, so one layer serves every swath.
+    """
+    if not swaths:
+        return
+
+    features = [
+        {
+            "type": "Feature",
+            "geometry": mapping(polygon),
+            "properties": {"color": color, "popup": popup},
+        }
+        for polygon, color, popup in swaths
+    ]
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name=name,
+        style_function=_swath_style,
+        popup=folium.GeoJsonPopup(
+            fields=["popup"],
+            labels=False,
+            localize=False,
+            max_width=600,
+        ),
+    ).add_to(parent)
+
+
+class _Legend(MacroElement):
+    """Fixed-position legend listing the OPERA datasets and their colors."""
+
+    _template = Template("""
+    {% macro html(this, kwargs) %}
+    <div style="position: fixed;
+                bottom: 50px; left: 50px; width: 220px; height: auto;
+                z-index:9999; font-size:14px;
+                background-color: white;
+                padding: 10px;
+                border: 2px solid grey;
+                border-radius: 5px;">
+    <b>OPERA Products</b><br>
+    {% for name, color in this.legend_items %}
+        <div style="margin-bottom:4px">
+            <span style="display:inline-block; width:12px; height:12px;
+                        background-color:{{ color }}; margin-right:6px">
+            </span>
+            {{ name }}
+        </div>
+    {% endfor %}
+    </div>
+    {% endmacro %}
+    """)
+
+    def __init__(self, legend_items):
+        super().__init__()
+        self.legend_items = legend_items
+
+
+class _MultiPopup(MacroElement):
+    """One popup open per type (overpass / station), independent of each other."""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            L.Popup.prototype.options.autoClose = false;
+            L.Popup.prototype.options.closeOnClick = false;
+            var _lastStationPopup = null;
+            var _lastOverpassPopup = null;
+            var _map = {{ this._parent.get_name() }};
+
+            _map.on('popupopen', function(e) {
+                var source = e.layer || e.sourceTarget;
+                var isMarker = source && source instanceof L.Marker;
+                if (isMarker) {
+                    if (_lastStationPopup && _lastStationPopup !== e.popup) {
+                        _map.removeLayer(_lastStationPopup);
+                    }
+                    _lastStationPopup = e.popup;
+                } else {
+                    if (_lastOverpassPopup && _lastOverpassPopup !== e.popup) {
+                        _map.removeLayer(_lastOverpassPopup);
+                    }
+                    _lastOverpassPopup = e.popup;
+                }
+            });
+        {% endmacro %}
+    """)
+
+
+def _to_hex(rgb: np.ndarray) -> list[str]:
+    """Format an (n, 3) array of 0–255 integers as #RRGGBB strings."""
+    # Hex-encode every byte at once, then slice six digits per color
+    digits = np.ascontiguousarray(rgb, dtype=np.uint8).tobytes().hex()
+    return ["#" + digits[k:k + 6] for k in range(0, len(digits), 6)]
+
+
+def _cached_palette(func):
+    """Memoize a palette generator on its size; each caller gets a fresh list."""
+    cached = lru_cache(maxsize=128)(lambda n: tuple(func(n)))
+
+    @wraps(func)
+    def wrapper(n: int) -> list[str]:
+        return list(cached(n))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_cached_palette
 def hsl_distinct_colors(n: int) -> list[str]:
     """Generate n distinct colors using HSV → RGB, returned as hex strings."""
-    colors: list[str] = []
-    for i in range(n):
-        # Generate colors with different hues
-        hue = i / float(n)
-        color = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        # Convert from RGB (0–1) to hex (#RRGGBB)
-        rgb = [int(c * 255) for c in color]
-        hex_color = "#{:02x}{:02x}{:02x}".format(*rgb)
-        colors.append(hex_color)
-    return colors
+    # Evenly spaced hues at full saturation/value; same arithmetic as
+    # colorsys.hsv_to_rgb, evaluated for every hue at once
+    hue6 = (np.arange(n) / float(n)) * 6.0
+    sector = hue6.astype(int)
+    f = hue6 - sector
+    q = 1.0 - f
+    t = 1.0 - q
+    ones, zeros = np.ones(n), np.zeros(n)
+    table = np.stack(
+        [
+            [ones, t, zeros],
+            [q, ones, zeros],
+            [zeros, ones, t],
+            [zeros, q, ones],
+            [t, zeros, ones],
+            [ones, zeros, q],
+        ]
+    )
+    rgb = table[sector % 6, :, np.arange(n)]
+    # Convert from RGB (0–1) to hex (#RRGGBB)
+    return _to_hex((rgb * 255).astype(int))
 
 
+@_cached_palette
 def spread_rgb_colors(n: int) -> list[str]:
     """Generate n RGB-based colors spread across the spectrum."""
-    colors: list[str] = []
     step = 255 // max(n, 1)
-    for i in range(n):
-        r = (i * step) % 256
-        g = ((i + 1) * step) % 256
-        b = ((i + 2) * step) % 256
-        hex_color = "#{:02x}{:02x}{:02x}".format(r, g, b)
-        colors.append(hex_color)
-    return colors
+    channels = np.arange(n)[:, None] + np.arange(3)
+    return _to_hex((channels * step) % 256)
 
 
+@_cached_palette
 def hsl_distinct_colors_improved(num_colors: int) -> list[str]:
-    """Generate visually distinct HSL-based colors with random saturation/lightness."""
-    colors: list[str] = []
-    for i in range(num_colors):
-        hue = (i * 360 / num_colors) % 360
-        saturation = random.randint(60, 80)
-        lightness = random.randint(30, 50)
-        r, g, b = colorsys.hls_to_rgb(hue / 360, lightness / 100, saturation / 100)
-        hex_color = "#{:02x}{:02x}{:02x}".format(
-            int(r * 255),
-            int(g * 255),
-            int(b * 255),
+    """Generate visually distinct, reproducible HSL-based colors.
+
+    Hues advance by the golden ratio so consecutive colors stay far apart,
+    with fixed saturation/lightness so the same input gives the same map.
+    """
+    hue = (_HUE_OFFSET + np.arange(num_colors) * _GOLDEN_RATIO_CONJUGATE) % 1.0
+    # colorsys.hls_to_rgb(hue, 0.40, 0.70) for all hues at once
+    lightness, saturation = 0.40, 0.70
+    m2 = lightness * (1.0 + saturation)
+    m1 = 2.0 * lightness - m2
+    channels = []
+    for offset in (1.0 / 3.0, 0.0, -1.0 / 3.0):
+        h = (hue + offset) % 1.0
+        channels.append(
+            np.select(
+                [h < 1.0 / 6.0, h < 0.5, h < 2.0 / 3.0],
+                [
+                    m1 + (m2 - m1) * h * 6.0,
+                    np.full_like(h, m2),
+                    m1 + (m2 - m1) * (2.0 / 3.0 - h) * 6.0,
+                ],
+                default=m1,
+            )
         )
-        colors.append(hex_color)
-    return colors
+    return _to_hex((np.stack(channels, axis=1) * 255).astype(int))
 
 
 def make_opera_granule_map(
@@ -82,8 +327,7 @@ def make_opera_granule_map(
     output_file = timestamp_dir / "opera_products_map.html"
 
     # Parse AOI center for initial map centering
-    bbox_parsed = bbox_type(bbox)
-    aoi_polygon, aoi, centroid = bbox_to_geometry(bbox_parsed, timestamp_dir)
+    aoi_polygon, centroid = _resolve_aoi(bbox, timestamp_dir)
     center_lat = centroid.y
     center_lon = centroid.x
 
@@ -91,14 +335,13 @@ def make_opera_granule_map(
     map_object = folium.Map(location=[center_lat, center_lon], zoom_start=7)
 
     # AOI bounding box
-    aoi_geojson = gpd.GeoSeries([aoi_polygon]).__geo_interface__
+    aoi_geojson = _aoi_geojson(aoi_polygon)
 
     folium.TileLayer("Esri.WorldImagery").add_to(map_object)
 
     # Generate distinct colors for layers
-    cmap = plt.get_cmap("tab20")
-    dataset_names = list(results_dict.keys())
-    colors = [to_hex(cmap(i % 20)) for i in range(len(dataset_names))]
+    tab20 = _tab20_colors()
+    colors = [tab20[i % 20] for i in range(len(results_dict))]
     legend_entries: list[tuple[str, str]] = []
 
     for i, (dataset, data) in enumerate(results_dict.items()):
@@ -107,66 +350,64 @@ def make_opera_granule_map(
             LOGGER.info("Skipping %s: empty or missing GeoDataFrame.", dataset)
             continue
 
-        gdf = gdf.copy()
-
         if i < 4:
             pos_delta = 0.08 * (i - 1)
         else:
             pos_delta = 0.08 * (i - 5)
 
         # Add download URL and name for popup
-        for idx, item in enumerate(data["results"]):
+        download_urls, labels = [], []
+        for item in data["results"]:
             try:
-                umm = item["umm"]
-                download_url = "N/A"
-                for url_entry in umm.get("RelatedUrls", []):
-                    if url_entry.get("Type") == "GET DATA":
-                        download_url = url_entry.get("URL", "N/A")
-                        break
-                label = umm.get("GranuleUR", "OPERA Granule")
+                label, _, _, download_url = extract_umm_fields(
+                    item["umm"],
+                    default_id="OPERA Granule",
+                )
             except Exception as e:  # noqa: BLE001
                 LOGGER.info("Unexpected error while parsing UMM: %s", e)
                 download_url = "URL not available"
                 label = "OPERA Granule"
 
-            gdf.iloc[idx, gdf.columns.get_loc("URL")] = download_url
-            gdf.iloc[idx, gdf.columns.get_loc("GranuleUR")] = label
+            download_urls.append(download_url)
+            labels.append(label)
 
         # Set the color of the icon and geometry
         color = colors[i]
-        style = {
-            "color": color,
-            "fillColor": color,
-            "weight": 2,
-            "fillOpacity": 0.5,
-        }
 
         feature_group = folium.FeatureGroup(name=dataset)
 
-        # Add geometries
+        # Add geometries; popups come from the markers, so the layer
+        # only needs the shapes and not every attribute column
         folium.GeoJson(
-            gdf.__geo_interface__,
-            style_function=lambda x, style=style: style,
+            gdf.geometry.__geo_interface__,
+            style_function=_make_style_fn(color),
         ).add_to(feature_group)
 
-        # Add popup markers
-        for _, row in gdf.iterrows():
-            centroid = row.geometry.centroid
-            popup_html = f"""
-                <b>{row['GranuleUR']}</b><br>
-                <a href="{row['URL']}" target="_blank">
+        # Add popup markers (centroids computed in one vectorized pass)
+        centroids = shapely.centroid(gdf.geometry.to_numpy())
+        xs = shapely.get_x(centroids)
+        ys = shapely.get_y(centroids)
+        popups = [
+            f"""
+                <b>{label}</b><br>
+                <a href="{url}" target="_blank">
                     Download Granule
                 </a>
             """
-            folium.Marker(
-                location=[centroid.y + pos_delta, centroid.x + pos_delta],
-                popup=folium.Popup(popup_html, max_width=400),
-                icon=folium.Icon(
-                    color="lightgray",
-                    icon_color=color,
-                    icon="cloud-download",
-                ),
-            ).add_to(feature_group)
+            for label, url in zip(labels, download_urls)
+        ]
+        _add_marker_layer(
+            feature_group,
+            ys + pos_delta,
+            xs + pos_delta,
+            popups,
+            icon=folium.Icon(
+                color="lightgray",
+                icon_color=color,
+                icon="cloud-download",
+            ),
+            max_width=400,
+        )
 
         feature_group.add_to(map_object)
         legend_entries.append((dataset, color))
@@ -175,43 +416,14 @@ def make_opera_granule_map(
     folium.GeoJson(
         aoi_geojson,
         name="AOI",
-        style_function=lambda x: {"color": "black", "weight": 2, "fillOpacity": 0.0},
+        style_function=_aoi_style,
     ).add_to(map_object)
 
     folium.LayerControl().add_to(map_object)
 
-    # Legend template
-    legend_html = """
-    {% macro html(this, kwargs) %}
-    <div style="position: fixed;
-                bottom: 50px; left: 50px; width: 220px; height: auto;
-                z-index:9999; font-size:14px;
-                background-color: white;
-                padding: 10px;
-                border: 2px solid grey;
-                border-radius: 5px;">
-    <b>OPERA Products</b><br>
-    {% for name, color in this.legend_items %}
-        <div style="margin-bottom:4px">
-            <span style="display:inline-block; width:12px; height:12px;
-                        background-color:{{ color }}; margin-right:6px">
-            </span>
-            {{ name }}
-        </div>
-    {% endfor %}
-    </div>
-    {% endmacro %}
-    """
-
-    class Legend(MacroElement):
-        def __init__(self, legend_items):
-            super().__init__()
-            self._template = Template(legend_html)
-            self.legend_items = legend_items
-
-    map_object.get_root().add_child(Legend(legend_entries))
+    map_object.get_root().add_child(_Legend(legend_entries))
 
-    map_object.save(output_file)
+    _save_map(map_object, output_file)
     LOGGER.info("-> OPERA granules Map successfully saved to %s", output_file)
     return map_object
 
@@ -234,21 +446,22 @@ def make_opera_granule_drcs_map(
     output_file = timestamp_dir / "opera_products_drcs_map.html"
 
     # Parse AOI
-    bbox_parsed = bbox_type(bbox)
-    aoi_polygon, aoi, centroid = bbox_to_geometry(bbox_parsed, timestamp_dir)
+    aoi_polygon, centroid = _resolve_aoi(bbox, timestamp_dir)
     center_lat = centroid.y
     center_lon = centroid.x
 
     map_object = folium.Map(location=[center_lat, center_lon], zoom_start=7)
 
-    aoi_geojson = gpd.GeoSeries([aoi_polygon]).__geo_interface__
+    aoi_geojson = _aoi_geojson(aoi_polygon)
     folium.TileLayer("Esri.WorldImagery").add_to(map_object)
 
-    cmap = plt.get_cmap("tab20")
-    dataset_names = list(results_dict.keys())
-    colors = [to_hex(cmap(i % 20)) for i in range(len(dataset_names))]
+    tab20 = _tab20_colors()
+    colors = [tab20[i % 20] for i in range(len(results_dict))]
     legend_entries: list[tuple[str, str]] = []
 
+    # Parse the overpass tables once for every old-granule report
+    overpass_index = build_overpass_index(result_s1, result_s2, result_l)
+
     # Loop over OPERA products
     for i, (dataset, data) in enumerate(results_dict.items()):
         # Skip ANN at the moment
@@ -260,32 +473,42 @@ def make_opera_granule_drcs_map(
             LOGGER.info("Skipping %s: empty or missing GeoDataFrame.", dataset)
             continue
 
-        gdf = gdf.copy()
         if i < 4:
             pos_delta = 0.08 * (i - 1)
         else:
             pos_delta = 0.08 * (i - 5)
 
         feature_group = folium.FeatureGroup(name=dataset)
-        gdf = gdf.reset_index(drop=True)
+        # Rendering only needs the footprints and the per-granule flag
+        gdf = gdf[["geometry"]].reset_index(drop=True)
+
+        # Marker positions for every granule in one vectorized pass
+        geometries = gdf.geometry.to_numpy()
+        centroids = shapely.centroid(geometries)
+        xs = shapely.get_x(centroids)
+        ys = shapely.get_y(centroids)
+
+        # Footprints clipped to the AOI for the overpass reports
+        if aoi_polygon.area > 0:
+            clipped = shapely.intersection(geometries, aoi_polygon)
+        else:
+            clipped = geometries
 
         # Add download URL and name, decorate popups with DRCS logic
+        condition_flags = []
+        popups = []
         for idx, item in enumerate(data["results"]):
             try:
-                umm = item["umm"]
-                download_url = "N/A"
-                for url_entry in umm.get("RelatedUrls", []):
-                    if url_entry.get("Type") == "GET DATA":
-                        download_url = url_entry.get("URL", "N/A")
-                        break
-                label = umm.get("GranuleUR", "OPERA Granule")
+                label, _, _, download_url = extract_umm_fields(
+                    item["umm"],
+                    default_id="OPERA Granule",
+                )
 
                 parts = label.split("_")
                 if len(parts) > 2 and parts[2] == "DISP-S1":
-                    aqu_date = datetime.strptime(parts[7], "%Y%m%dT%H%M%SZ")
+                    aqu_date_utc = _parse_compact_utc(parts[7])
                 else:
-                    aqu_date = datetime.strptime(parts[4], "%Y%m%dT%H%M%SZ")
-                aqu_date_utc = aqu_date.replace(tzinfo=timezone.utc)
+                    aqu_date_utc = _parse_compact_utc(parts[4])
             except Exception as e:
                 LOGGER.info("Unexpected error while parsing UMM/label: %s", e)
                 download_url = "URL not available"
@@ -294,36 +517,26 @@ def make_opera_granule_drcs_map(
                     event_date
                 )  # force pre-event
 
-            geom = gdf.iloc[idx].geometry
-            centroid = geom.centroid
-
             condition_ok = aqu_date_utc > event_date
 
             if condition_ok:
-                color = colors[i]
                 popup_html = f"""
                     <b>{label}</b><br>
                     <a href="{download_url}" target="_blank">
                         Download Granule
                     </a>
                 """
-                url_value = download_url
-                label_value = label
             else:
-                if aoi_polygon.area > 0:
-                    product_geom = geom.intersection(aoi_polygon)
-                else:
-                    product_geom = geom
                 report = check_opera_overpass_intersection(
                     label,
-                    product_geom,
+                    clipped[idx],
                     result_s1,
                     result_s2,
                     result_l,
                     event_date,
                     dataset_name=dataset,
+                    overpass_index=overpass_index,
                 )
-                color = "lightgray"
                 sentences_html = (
                     report.replace("\n", "<br>")
                     if report
@@ -333,27 +546,38 @@ def make_opera_granule_drcs_map(
                 <b>Not available yet:</b><br>
                 {sentences_html}
                 """
-                url_value = "N/A"
-                label_value = f"{label} (old granule)"
-
-            # Update GeoDataFrame
-            gdf.at[idx, "URL"] = url_value
-            gdf.at[idx, "GranuleUR"] = label_value
-            gdf.at[idx, "condition_ok"] = condition_ok
 
-            folium.Marker(
-                location=[centroid.y + pos_delta, centroid.x + pos_delta],
-                popup=folium.Popup(popup_html, max_width=800),
+            condition_flags.append(condition_ok)
+            popups.append(popup_html)
+
+        # One marker layer for available granules, one for older ones
+        flags = np.array(condition_flags, dtype=bool)
+        popup_array = np.array(popups, dtype=object)
+        for ok, icon_color, icon_name in (
+            (True, colors[i], "cloud-download"),
+            (False, "lightgray", "info-sign"),
+        ):
+            keep = flags == ok
+            if not keep.any():
+                continue
+            _add_marker_layer(
+                feature_group,
+                ys[keep] + pos_delta,
+                xs[keep] + pos_delta,
+                list(popup_array[keep]),
                 icon=folium.Icon(
-                    color=color if condition_ok else "lightgray",
+                    color=icon_color,
                     icon_color="white",
-                    icon="cloud-download" if condition_ok else "info-sign",
+                    icon=icon_name,
                 ),
-            ).add_to(feature_group)
+                max_width=800,
+            )
 
         style_func = style_function_factory(colors[i])
+        # Build the GeoJSON dict directly (no to_json/json.loads round
+        # trip) with just the column the style function reads
         folium.GeoJson(
-            data=json.loads(gdf.to_json()),
+            data=gdf.assign(condition_ok=condition_flags).__geo_interface__,
             style_function=style_func,
             name=f"{dataset}_geojson",
         ).add_to(feature_group)
@@ -365,43 +589,14 @@ def make_opera_granule_drcs_map(
     folium.GeoJson(
         aoi_geojson,
         name="AOI",
-        style_function=lambda x: {"color": "black",
-                                  "weight": 2, "fillOpacity": 0.0},
+        style_function=_aoi_style,
     ).add_to(map_object)
 
     folium.LayerControl().add_to(map_object)
 
-    legend_html = """
-    {% macro html(this, kwargs) %}
-    <div style="position: fixed;
-                bottom: 50px; left: 50px; width: 220px; height: auto;
-                z-index:9999; font-size:14px;
-                background-color: white;
-                padding: 10px;
-                border: 2px solid grey;
-                border-radius: 5px;">
-    <b>OPERA Products</b><br>
-    {% for name, color in this.legend_items %}
-        <div style="margin-bottom:4px">
-            <span style="display:inline-block; width:12px; height:12px;
-                        background-color:{{ color }}; margin-right:6px">
-            </span>
-            {{ name }}
-        </div>
-    {% endfor %}
-    </div>
-    {% endmacro %}
-    """
-
-    class Legend(MacroElement):
-        def __init__(self, legend_items):
-            super().__init__()
-            self._template = Template(legend_html)
-            self.legend_items = legend_items
-
-    map_object.get_root().add_child(Legend(legend_entries))
+    map_object.get_root().add_child(_Legend(legend_entries))
 
-    map_object.save(output_file)
+    _save_map(map_object, output_file)
     LOGGER.info(
         "-> DRCS OPERA granules Map successfully saved to %s",
         output_file,
@@ -440,13 +635,12 @@ def make_overpasses_map(
             satellites[name] = (next_collect_info, next_collect_geometry)
 
     # Parse AOI
-    bbox_parsed = bbox_type(bbox)
-    aoi_polygon, aoi, centroid = bbox_to_geometry(bbox_parsed, timestamp_dir)
+    aoi_polygon, centroid = _resolve_aoi(bbox, timestamp_dir)
     center_lat = centroid.y
     center_lon = centroid.x
 
     map_object = folium.Map(location=[center_lat, center_lon], zoom_start=5)
-    aoi_geojson = gpd.GeoSeries([aoi_polygon]).__geo_interface__
+    aoi_geojson = _aoi_geojson(aoi_polygon)
 
     for sat_name, (info_text, geometry_list) in satellites.items():
         if not geometry_list:
@@ -455,7 +649,7 @@ def make_overpasses_map(
         info_list = satellite_results[sat_name].get("next_collect_summary")
         if not info_list:
             lines = info_text.split("\n")
-            cleaned_info = [line for line in lines if re.search(r"[1-9]", line)]
+            cleaned_info = [line for line in lines if _RE_NONZERO_DIGIT.search(line)]
             info_list = cleaned_info
         num_polygons = len(geometry_list)
 
@@ -466,13 +660,19 @@ def make_overpasses_map(
             fg_8_desc = folium.FeatureGroup(name=f"{sat_name} 8 Descending")
             fg_9_asc = folium.FeatureGroup(name=f"{sat_name} 9 Ascending")
             fg_9_desc = folium.FeatureGroup(name=f"{sat_name} 9 Descending")
+            group_swaths: dict = {
+                fg_8_asc: [],
+                fg_8_desc: [],
+                fg_9_asc: [],
+                fg_9_desc: [],
+            }
 
             for i, (polygon, info) in enumerate(zip(geometry_list, info_list)):
                 sat_num = 8 if i % 2 == 0 else 9
 
-                if re.search(r"ascending", info, re.IGNORECASE):
+                if _RE_ASCENDING.search(info):
                     asc_desc = "Ascending"
-                elif re.search(r"descending", info, re.IGNORECASE):
+                elif _RE_DESCENDING.search(info):
                     asc_desc = "Descending"
                 else:
                     asc_desc = "Unknown"
@@ -493,46 +693,30 @@ def make_overpasses_map(
                     group = fg_8_asc
                     color = "gray"
 
-                geojson_data = gpd.GeoSeries([polygon]).__geo_interface__
                 info_html = info.replace("\n", "<br>") if isinstance(info, str) else str(info)
-                folium.GeoJson(
-                    geojson_data,
-                    name=f"{sat_name} Path/Row",
-                    style_function=lambda x, color=color: {
-                        "color": color,
-                        "weight": 2,
-                        "fillOpacity": 0.3,
-                    },
-                    popup=folium.Popup(f"<b>{sat_name}</b><br>{info_html}", max_width=600),
-                ).add_to(group)
-
-            fg_8_asc.add_to(map_object)
-            fg_8_desc.add_to(map_object)
-            fg_9_asc.add_to(map_object)
-            fg_9_desc.add_to(map_object)
+                group_swaths[group].append(
+                    (polygon, color, f"<b>{sat_name}</b><br>{info_html}")
+                )
+
+            for group, swaths in group_swaths.items():
+                _add_swath_layer(group, swaths, name=f"{sat_name} Path/Row")
+                group.add_to(map_object)
         else:
             fg = folium.FeatureGroup(name=sat_name)
+            swaths = []
             for i, (polygon, info) in enumerate(zip(geometry_list, info_list), start=1):
                 if isinstance(polygon, Polygon):
-                    color = colors[i - 1]
-                    geojson_data = gpd.GeoSeries([polygon]).__geo_interface__
                     info_html = info.replace("\n", "<br>") if isinstance(info, str) else str(info)
-                    folium.GeoJson(
-                        geojson_data,
-                        name=f"{sat_name} Area {i}",
-                        style_function=lambda x, color=color: {
-                            "color": color,
-                            "weight": 2,
-                            "fillOpacity": 0.3,
-                        },
-                        popup=folium.Popup(f"<b>{sat_name}</b><br>{info_html}", max_width=600),
-                    ).add_to(fg)
+                    swaths.append(
+                        (polygon, colors[i - 1], f"<b>{sat_name}</b><br>{info_html}")
+                    )
+            _add_swath_layer(fg, swaths, name=f"{sat_name} Areas")
             fg.add_to(map_object)
 
     folium.GeoJson(
         aoi_geojson,
         name="AOI",
-        style_function=lambda x: {"color": "black", "weight": 2, "fillOpacity": 0.0},
+        style_function=_aoi_style,
     ).add_to(map_object)
 
     # NOAA tide stations — collect from all satellite results, deduplicate by ID
@@ -560,38 +744,8 @@ def make_overpasses_map(
 
     folium.LayerControl(collapsed=False).add_to(map_object)
 
-    class MultiPopup(MacroElement):
-        """One popup open per type (overpass / station), independent of each other."""
-        def __init__(self):
-            super().__init__()
-            self._template = Template("""
-                {% macro script(this, kwargs) %}
-                    L.Popup.prototype.options.autoClose = false;
-                    L.Popup.prototype.options.closeOnClick = false;
-                    var _lastStationPopup = null;
-                    var _lastOverpassPopup = null;
-                    var _map = {{ this._parent.get_name() }};
-
-                    _map.on('popupopen', function(e) {
-                        var source = e.layer || e.sourceTarget;
-                        var isMarker = source && source instanceof L.Marker;
-                        if (isMarker) {
-                            if (_lastStationPopup && _lastStationPopup !== e.popup) {
-                                _map.removeLayer(_lastStationPopup);
-                            }
-                            _lastStationPopup = e.popup;
-                        } else {
-                            if (_lastOverpassPopup && _lastOverpassPopup !== e.popup) {
-                                _map.removeLayer(_lastOverpassPopup);
-                            }
-                            _lastOverpassPopup = e.popup;
-                        }
-                    });
-                {% endmacro %}
-            """)
-
-    map_object.get_root().add_child(MultiPopup())
-
-    map_object.save(output_file)
+    map_object.get_root().add_child(_MultiPopup())
+
+    _save_map(map_object, output_file)
     LOGGER.info("-> Satellite overpasses map successfully saved to %s", output_file)
     return map_object
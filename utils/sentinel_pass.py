@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -6,7 +7,7 @@ import geopandas as gpd
 import pandas as pd
 from tabulate import tabulate
 
-from utils.cloudiness import make_get_cloudiness_for_row
+from utils.cloudiness import make_get_cloudiness_batch
 from utils.tide_prediction import (
     make_get_tide_for_row,
     get_stations_in_aoi,
@@ -21,17 +22,29 @@ SENT1_URL = "https://sentinels.copernicus.eu/web/sentinel/copernicus/sentinel-1/
 SENT2_URL = "https://sentinels.copernicus.eu/web/sentinel/copernicus/sentinel-2/acquisition-plans"
 
 
+def format_date_cells(date_lists, per_line: int = 5) -> list[str]:
+    """Format several rows of acquisition dates in one vectorized pass."""
+    date_lists = list(date_lists)
+    stamps = pd.to_datetime(pd.Series(date_lists, dtype=object).explode(), utc=True)
+    text = stamps.dt.strftime("%Y-%m-%d %H:%M:%S")
+    text = text.where(stamps >= pd.Timestamp.now(tz="UTC"), text + " (P)")
+    by_row = text.dropna().groupby(level=0).agg(list).to_dict()
+
+    cells = []
+    for position in range(len(date_lists)):
+        formatted_dates = by_row.get(position, [])
+        cells.append(
+            "\n".join(
+                ", ".join(formatted_dates[i:i + per_line])
+                for i in range(0, len(formatted_dates), per_line)
+            )
+        )
+    return cells
+
+
 def format_date_lines(dates: list[datetime], per_line: int = 5) -> str:
     """Wrap Sentinel acquisition dates across multiple lines."""
-    formatted_dates = [
-        d.strftime("%Y-%m-%d %H:%M:%S")
-        + (" (P)" if d < datetime.now(timezone.utc) else "")
-        for d in dates
-    ]
-    return "\n".join(
-        ", ".join(formatted_dates[i:i + per_line])
-        for i in range(0, len(formatted_dates), per_line)
-    )
+    return format_date_cells([dates], per_line)[0]
 
 
 def build_collect_summaries(gdf: gpd.GeoDataFrame) -> list[str]:
@@ -45,12 +58,14 @@ def build_collect_summaries(gdf: gpd.GeoDataFrame) -> list[str]:
     has_cloudiness = "cloudiness" in gdf.columns
     has_tide = "tide" in gdf.columns
 
-    for _, row in gdf.iterrows():
+    date_cells = format_date_cells(gdf["begin_date"])
+
+    for row, dates_str in zip(gdf.itertuples(), date_cells):
         parts = []
         if has_platform:
             parts.append(f"Platform: {row.platform}")
         parts.append(f"Relative Orbit: {row.orbit_relative}")
-        parts.append(f"Collection Date & UTC Time (P = past):\n{format_date_lines(row.begin_date)}")
+        parts.append(f"Collection Date & UTC Time (P = past):\n{dates_str}")
         parts.append(f"AOI % Overlap: {row.intersection_pct:.2f}")
 
         if has_cloudiness:
@@ -91,11 +106,19 @@ def build_collect_summaries(gdf: gpd.GeoDataFrame) -> list[str]:
     return summaries
 
 
-def create_s1_collection_plan(n_day_past: float) -> Path:
+def _scrape_platform_urls(url: str, classes: list[str]) -> list[list[str]]:
+    """Scrape the plan links of several platforms concurrently."""
+    with ThreadPoolExecutor(max_workers=len(classes)) as executor:
+        return list(executor.map(lambda class_: scrape_esa_download_urls(url, class_), classes))
+
+
+def create_s1_collection_plan(
+    n_day_past: float,
+) -> tuple[Path, gpd.GeoDataFrame | None]:
     """Prepare Sentinel-1 acquisition plan collection."""
-    urls_a = scrape_esa_download_urls(SENT1_URL, "sentinel-1a")
-    urls_c = scrape_esa_download_urls(SENT1_URL, "sentinel-1c")
-    urls_d = scrape_esa_download_urls(SENT1_URL, "sentinel-1d")
+    urls_a, urls_c, urls_d = _scrape_platform_urls(
+        SENT1_URL, ["sentinel-1a", "sentinel-1c", "sentinel-1d"]
+    )
     urls = urls_a + urls_c + urls_d
 
     platforms = ["S1A"] * len(urls_a) + ["S1C"] * len(urls_c) + ["S1D"] * len(urls_d)
@@ -104,17 +127,19 @@ def create_s1_collection_plan(n_day_past: float) -> Path:
         urls,
         n_day_past,
         "sentinel1",
-        "sentinel_1_collection.geojson",
+        "sentinel_1_collection.fgb",
         LOGGER,
         platforms,
     )
 
 
-def create_s2_collection_plan(n_day_past: float) -> Path:
+def create_s2_collection_plan(
+    n_day_past: float,
+) -> tuple[Path, gpd.GeoDataFrame | None]:
     """Prepare Sentinel-2 acquisition plan collection."""
-    urls_a = scrape_esa_download_urls(SENT2_URL, "sentinel-2a")
-    urls_b = scrape_esa_download_urls(SENT2_URL, "sentinel-2b")
-    urls_c = scrape_esa_download_urls(SENT2_URL, "sentinel-2c")
+    urls_a, urls_b, urls_c = _scrape_platform_urls(
+        SENT2_URL, ["sentinel-2a", "sentinel-2b", "sentinel-2c"]
+    )
     urls = urls_a + urls_b + urls_c
 
     platforms = (
@@ -125,7 +150,7 @@ def create_s2_collection_plan(n_day_past: float) -> Path:
         urls,
         n_day_past,
         "sentinel2",
-        "sentinel_2_collection.geojson",
+        "sentinel_2_collection.fgb",
         LOGGER,
         platforms,
     )
@@ -146,9 +171,10 @@ def format_collects(gdf: gpd.GeoDataFrame) -> str:
     )
 
     table = []
+    date_cells = format_date_cells(gdf_sorted["begin_date"])
 
-    for i, row in gdf_sorted.iterrows():
-        base_row = [i + 1]  # Row number
+    for row, dates_str in zip(gdf_sorted.itertuples(), date_cells):
+        base_row = [row.Index + 1]  # Row number
 
         if has_platform:
             base_row.append(row.platform)
@@ -157,7 +183,6 @@ def format_collects(gdf: gpd.GeoDataFrame) -> str:
         base_row.append(row.orbit_relative)
 
         # Dates
-        dates_str = format_date_lines(row.begin_date)
         base_row.append(dates_str)
 
         # Intersection %
@@ -205,17 +230,6 @@ def unique_geometry_per_orbit(collects: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     separating S1A, S1C and S1D even if they share the same orbit.
     """
 
-    def first_unique_geoms(geoms):
-        """Keep only unique geometries based on WKT."""
-        seen = set()
-        unique = []
-        for g in geoms:
-            wkt = g.wkt
-            if wkt not in seen:
-                seen.add(wkt)
-                unique.append(g)
-        return unique
-
     has_cloudiness = "cloudiness" in collects.columns
 
     # Ensure begin_date is datetime
@@ -223,10 +237,11 @@ def unique_geometry_per_orbit(collects: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         collects["begin_date"], format="ISO8601", errors="raise"
     )
 
-    # Aggregation dictionary
+    # Aggregation dictionary; only the first geometry of each orbit is
+    # kept, so it is taken directly instead of de-duplicating by WKT
     agg_dict: dict = {
-        "begin_date": lambda dates: sorted(dates),
-        "geometry": first_unique_geoms,
+        "begin_date": sorted,
+        "geometry": "first",
         "intersection_pct": "first",
     }
 
@@ -238,12 +253,7 @@ def unique_geometry_per_orbit(collects: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     if "platform" in collects.columns and collects["platform"].notna().any():
         groupby_cols.append("platform")
 
-    grouped = collects.groupby(groupby_cols).agg(agg_dict).reset_index()
-
-    # Flatten geometry list to first geometry only
-    grouped["geometry"] = grouped["geometry"].apply(
-        lambda geoms: geoms[0] if geoms else None
-    )
+    grouped = collects.groupby(groupby_cols, observed=True).agg(agg_dict).reset_index()
 
     # Sort by intersection percentage
     grouped = grouped.sort_values("intersection_pct", ascending=False
@@ -277,9 +287,9 @@ def next_sentinel_pass(
     """
     try:
         if sat == "sentinel1":
-            gdf = gpd.read_file(create_s1_collection_plan(n_day_past))
+            _, gdf = create_s1_collection_plan(n_day_past)
         elif sat == "sentinel2":
-            gdf = gpd.read_file(create_s2_collection_plan(n_day_past))
+            _, gdf = create_s2_collection_plan(n_day_past)
         else:
             LOGGER.error("Unsupported satellite identifier: %s", sat)
             return {
@@ -289,38 +299,36 @@ def next_sentinel_pass(
             }
     except (IOError, OSError) as e:
         LOGGER.error("Error reading Sentinel plan file: %s", e)
+        gdf = None
+
+    # The plan builder logs its own failures and returns no frame
+    if gdf is None:
         return {
             "next_collect_info": "Error reading plan file.",
             "next_collect_geometry": None,
             "intersection_pct": None,
         }
 
-    if "platform" not in gdf.columns:
+    # The intersecting collects keep the plan's columns
+    has_platform = "platform" in gdf.columns
+    if not has_platform:
         LOGGER.warning(
             "The collection plan does not contain a 'platform' column.")
 
     collects = find_intersecting_collects(gdf, geometry)
-    dedupe_cols = ["begin_date", "orbit_relative"]
-    if "platform" in collects.columns:
-        dedupe_cols.append("platform")
-    collects = collects.drop_duplicates(subset=dedupe_cols)
-
-    if "platform" not in gdf.columns:
-        LOGGER.warning(
-            "The collection plan does not contain a 'platform' column.")
 
     if not collects.empty:
         groupby_cols = ["orbit_relative"]
-        if "platform" in collects.columns and collects["platform"
-                                                       ].notna().any():
+        if has_platform and collects["platform"].notna().any():
             groupby_cols.append("platform")
 
-        # Group collects by orbit, aggregate timestamps as list
+        # Group collects by orbit, aggregate timestamps as list; repeated
+        # timestamps within an orbit are dropped in the same pass
         collects_grouped = (
-            collects.groupby(groupby_cols, sort=False)
+            collects.groupby(groupby_cols, observed=True, sort=False)
             .agg(
                 {
-                    "begin_date": list,
+                    "begin_date": lambda dates: list(dict.fromkeys(dates)),
                     "geometry": "first",
                     "intersection_pct": "first",
                 }
@@ -335,10 +343,10 @@ def next_sentinel_pass(
                 "Calculating cloudiness for %d overpasses ...",
                 num_rows,
             )
-            get_cloudiness_for_row = make_get_cloudiness_for_row(geometry)
-            collects_grouped["cloudiness"] = collects_grouped.apply(
-                get_cloudiness_for_row,
-                axis=1,
+            get_cloudiness_batch = make_get_cloudiness_batch(geometry)
+            collects_grouped["cloudiness"] = get_cloudiness_batch(
+                collects_grouped["geometry"],
+                collects_grouped["begin_date"],
             )
         # tide prediction
         noaa_stations = None
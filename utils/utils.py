@@ -3,20 +3,24 @@ import logging
 import os
 import re
 import json
+import threading
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 from urllib.parse import urljoin
 from shapely.geometry import shape, Polygon
-from shapely import LinearRing, Point
+from shapely import Point
 from lxml import etree
-from bs4 import BeautifulSoup
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-from lxml import etree
-from shapely import LinearRing, Point, Polygon, wkt
+import shapely
+from lxml import etree, html
+from shapely import Point, Polygon, wkt
 from shapely.geometry import shape, box
 from timezonefinder import TimezoneFinder
 from zoneinfo import ZoneInfo
@@ -65,14 +69,48 @@ class Tee:
             stream.flush()
 
 
+# Parsed ESA acquisition-plan pages, keyed by URL: (fetch time, tree).
+# Every platform of a mission lives on the same page, so one fetch serves
+# all of them for ESA_PAGE_TTL seconds.
+ESA_PAGE_TTL = 3600
+_ESA_PAGE_CACHE: dict = {}
+# One lock per URL, so only callers of the same page wait for its fetch;
+# _ESA_PAGE_LOCK only guards creating those locks.
+_ESA_PAGE_LOCKS: dict = {}
+_ESA_PAGE_LOCK = threading.Lock()
+
+# Plan pages and their KML files share one host; a single session keeps
+# the connection alive across the page fetch and the concurrent downloads.
+ESA_SESSION = requests.Session()
+
+# Links inside the first <div> carrying the platform class (e.g. "sentinel-1a")
+_XP_ESA_LINKS = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $class_, ' '))])[1]"
+    "//a/@href",
+    smart_strings=False,
+)
+
+
+def _fetch_esa_page(url: str) -> etree._Element:
+    """Fetch and parse an ESA plan page, reusing a recent copy."""
+    with _ESA_PAGE_LOCK:
+        url_lock = _ESA_PAGE_LOCKS.setdefault(url, threading.Lock())
+
+    with url_lock:
+        cached = _ESA_PAGE_CACHE.get(url)
+        if cached is not None and time.monotonic() - cached[0] < ESA_PAGE_TTL:
+            return cached[1]
+
+        response = ESA_SESSION.get(url)
+        response.raise_for_status()
+        root = html.fromstring(response.content)
+        _ESA_PAGE_CACHE[url] = (time.monotonic(), root)
+        return root
+
+
 def scrape_esa_download_urls(url: str, class_: str) -> List[str]:
     """Scrape ESA website for KML download URLs."""
-    response = requests.get(url)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
-    div = soup.find("div", class_=class_)
-    hrefs = [a["href"] for a in div.find_all("a", href=True)]
+    hrefs = _XP_ESA_LINKS(_fetch_esa_page(url), class_=class_)
     clean_hrefs = []
     for href in hrefs:
         if href.startswith("https://sentinel/"):
@@ -94,43 +132,72 @@ def is_existing_path(s: str) -> bool:
 
 def download_kml(url: str, out_path: str = "collection.kml") -> Path:
     """Download a KML file from a URL."""
-    response = requests.get(url)
+    response = ESA_SESSION.get(url)
     response.raise_for_status()
     path = Path(out_path)
     path.write_bytes(response.content)
-    LOGGER.info(f"File downloaded successfully: {path}")
+    LOGGER.info("File downloaded successfully: %s", path)
     return path
 
 
+KML_NS = "http://www.opengis.net/kml/2.2"
+_KML_NAMESPACES = {"k": KML_NS}
+_KML_PLACEMARK_TAG = f"{{{KML_NS}}}Placemark"
+
+# Placemark field lookups, compiled once and reused for every placemark;
+# plain strings so results do not keep the parsed elements alive
+_XP_BEGIN = etree.XPath(
+    ".//k:begin/text()", namespaces=_KML_NAMESPACES, smart_strings=False
+)
+_XP_END = etree.XPath(
+    ".//k:end/text()", namespaces=_KML_NAMESPACES, smart_strings=False
+)
+_XP_MODE = etree.XPath(
+    ".//k:ExtendedData//k:Data[@name='Mode']/k:value/text()",
+    namespaces=_KML_NAMESPACES,
+    smart_strings=False,
+)
+_XP_ORBIT_ABSOLUTE = etree.XPath(
+    ".//k:ExtendedData//k:Data[@name='OrbitAbsolute']/k:value/text()",
+    namespaces=_KML_NAMESPACES,
+    smart_strings=False,
+)
+_XP_ORBIT_RELATIVE = etree.XPath(
+    ".//k:ExtendedData//k:Data[@name='OrbitRelative']/k:value/text()",
+    namespaces=_KML_NAMESPACES,
+    smart_strings=False,
+)
+_XP_COORDINATES = etree.XPath(
+    ".//k:LinearRing/k:coordinates/text()",
+    namespaces=_KML_NAMESPACES,
+    smart_strings=False,
+)
+
+
 def parse_placemark(placemark: etree.Element) -> Optional[Tuple]:
-    """Parse a single placemark from KML."""
-    ns = ".//{http://www.opengis.net/kml/2.2}"
-    # Replace 'Z' with '+00:00' for Python 3.10 compatibility
-    # Sentinel KML files use ISO format with 'Z' suffix (e.g., "2026-06-28T18:03:59Z")
-    begin_date = datetime.fromisoformat(placemark.find(f"{ns}begin").text.replace("Z", "+00:00"))
-    end_date = datetime.fromisoformat(placemark.find(f"{ns}end").text.replace("Z", "+00:00"))
+    """Parse a single placemark from KML.
 
-    data = placemark.find(f"{ns}ExtendedData")
-    mode = data.find(f"{ns}Data[@name='Mode']/{ns}value").text
-    orbit_absolute = int(data.find(f"{ns}Data[@name='OrbitAbsolute']/{ns}value").text)
-    orbit_relative = int(data.find(f"{ns}Data[@name='OrbitRelative']/{ns}value").text)
+    Dates are returned as their raw ISO strings; ``parse_kml`` converts
+    them for all placemarks at once.
+    """
+    begin_date = _XP_BEGIN(placemark)[0]
+    end_date = _XP_END(placemark)[0]
+
+    mode = _XP_MODE(placemark)[0]
+    orbit_absolute = int(_XP_ORBIT_ABSOLUTE(placemark)[0])
+    orbit_relative = int(_XP_ORBIT_RELATIVE(placemark)[0])
 
-    coords_text = placemark.find(f"{ns}LinearRing/{ns}coordinates").text.strip()
-    coords = [tuple(map(float, coord.split(",")[:2])) for coord in coords_text.split()]
-    footprint = Polygon(LinearRing(coords))
+    # Parse every "lon,lat[,alt]" tuple in one pass and keep lon/lat
+    coords_text = _XP_COORDINATES(placemark)[0].strip()
+    dims = coords_text.split(None, 1)[0].count(",") + 1
+    values = np.fromstring(coords_text.replace(",", " "), sep=" ")
+    footprint = Polygon(values.reshape(-1, dims)[:, :2])
 
     return (begin_date, end_date, mode, orbit_absolute, orbit_relative, footprint)
 
 
 def parse_kml(kml_path: Path) -> gpd.GeoDataFrame:
     """Parse a KML file into a GeoDataFrame."""
-    tree = etree.parse(kml_path)
-    placemarks = [
-        parse_placemark(elem)
-        for elem in tree.findall(".//{http://www.opengis.net/kml/2.2}Placemark")
-    ]
-    placemarks = [p for p in placemarks if p]
-
     columns = [
         "begin_date",
         "end_date",
@@ -139,9 +206,28 @@ def parse_kml(kml_path: Path) -> gpd.GeoDataFrame:
         "orbit_relative",
         "geometry",
     ]
-    return gpd.GeoDataFrame(
-        placemarks, columns=columns, geometry="geometry", crs="EPSG:4326"
-    )
+    # Collect one list per column and build the frame column-wise
+    values = {column: [] for column in columns}
+    appenders = [values[column].append for column in columns]
+
+    # Stream placemarks and free each one once parsed, so large plans
+    # never hold the whole document tree in memory
+    for _, elem in etree.iterparse(str(kml_path), events=("end",), tag=_KML_PLACEMARK_TAG):
+        placemark = parse_placemark(elem)
+        if placemark:
+            for append, value in zip(appenders, placemark):
+                append(value)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    # Sentinel KML files use ISO format with 'Z' suffix (e.g., "2026-06-28T18:03:59Z")
+    for column in ("begin_date", "end_date"):
+        values[column] = pd.to_datetime(values[column], format="ISO8601", utc=True)
+    values["orbit_absolute"] = np.asarray(values["orbit_absolute"], dtype=np.int64)
+    values["orbit_relative"] = np.asarray(values["orbit_relative"], dtype=np.int64)
+
+    return gpd.GeoDataFrame(values, geometry="geometry", crs="EPSG:4326")
 
 
 def parse_kml_polygon_coords(kml_file: Path) -> List[Tuple[float, float]]:
@@ -164,7 +250,18 @@ def find_intersecting_collects(
     mode: Optional[str] = None,
     orbit_relative: Optional[int] = None,
 ) -> gpd.GeoDataFrame:
-    intersects = gdf[gdf.intersects(geometryAOI)].copy()
+    # Prune by bounding box through the spatial index, then test exactly;
+    # sorted positions keep the plan's row order
+    if geometryAOI.geom_type == "Point":
+        # Point AOIs: test the candidates against the raw coordinates
+        candidates = np.sort(gdf.sindex.query(geometryAOI))
+        hits = shapely.intersects_xy(
+            np.asarray(gdf.geometry.values[candidates]), geometryAOI.x, geometryAOI.y
+        )
+        positions = candidates[hits]
+    else:
+        positions = np.sort(gdf.sindex.query(geometryAOI, predicate="intersects"))
+    intersects = gdf.iloc[positions].copy()
 
     if mode:
         intersects = intersects[intersects["mode"] == mode]
@@ -186,11 +283,19 @@ def find_intersecting_collects(
     intersects_proj = intersects.to_crs(projected_crs)
     aoi_proj = aoi_series.to_crs(projected_crs)
 
-    intersects["intersection_pct"] = (
-                100 * intersects_proj.geometry
-                .intersection(aoi_proj.iloc[0]).area
-                / aoi_proj.area.iloc[0]
-            )
+    aoi_geom = aoi_proj.iloc[0]
+    footprints = np.asarray(intersects_proj.geometry.values)
+    # A footprint that contains the AOI covers all of it; only the others
+    # need the far costlier intersection geometry. The AOI is prepared once
+    # so each containment test reuses its edge index.
+    shapely.prepare(aoi_geom)
+    contained = shapely.within(aoi_geom, footprints)
+    overlap_pct = np.full(len(footprints), 100.0)
+    overlap_pct[~contained] = (
+        100 * shapely.area(shapely.intersection(footprints[~contained], aoi_geom))
+        / aoi_geom.area
+    )
+    intersects["intersection_pct"] = overlap_pct
     return intersects.sort_values(
         ["intersection_pct", "begin_date"],
         ascending=[False, True],
@@ -332,6 +437,18 @@ def bbox_type(arg_coords):
 
 
 def bbox_to_geometry(bbox, timestamp_dir):
+    """Return (geometry, bounds, centroid) for a parsed bbox argument.
+
+    The same AOI is resolved by the overpass search, the OPERA search and
+    every map, so results are cached and KML/GeoJSON files are read once.
+    """
+    if isinstance(bbox, list):
+        bbox = tuple(bbox)
+    return _bbox_to_geometry(bbox, Path(timestamp_dir))
+
+
+@lru_cache(maxsize=8)
+def _bbox_to_geometry(bbox, timestamp_dir):
     if isinstance(bbox, str):
         bbox_clean = bbox.strip()
         bbox_upper = bbox_clean.upper()
@@ -373,13 +490,12 @@ def arcgis_to_polygon(geometry):
 
 
 def get_spatial_extent_km(polygon_geojson):
-    # create a geodataframe from our polygon
     geom = shape(polygon_geojson)
-    gdf = gpd.GeoDataFrame(geometry=[geom], crs="EPSG:4326")
-    # Project to metric CRS (Web Mercator: EPSG 3857) to calculate in meters
-    gdf_proj = gdf.to_crs(epsg=3857)
-    # Get total bounds: [minx, miny, maxx, maxy]
-    minx, miny, maxx, maxy = gdf_proj.total_bounds
+    aoi = gpd.GeoSeries([geom], crs="EPSG:4326")
+    # Project to the local UTM zone so lengths and area are in true meters
+    # (Web Mercator inflates both away from the equator)
+    projected = aoi.to_crs(aoi.estimate_utm_crs()).iloc[0]
+    minx, miny, maxx, maxy = projected.bounds
 
     # Width and height in meters
     width_m = maxx - minx
@@ -392,10 +508,14 @@ def get_spatial_extent_km(polygon_geojson):
     return {
         "width_km": width_km,
         "height_km": height_km,
-        "area_km2": gdf_proj.geometry.area.sum() / 1e6,
+        "area_km2": projected.area / 1e6,
     }
 
 
+# Standalone YYYY-MM-DD dates in free text
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+
+
 def is_date_in_text(iso_date_str: str, text: str) -> bool:
     """
     Check if the date (YYYY-MM-DD) from an ISO timestamp
@@ -424,12 +544,33 @@ def is_date_in_text(iso_date_str: str, text: str) -> bool:
     # Extract YYYY-MM-DD
     date_only_str = parsed_date.strftime("%Y-%m-%d")
 
-    # Find all date-like patterns in the text
-    dates_in_text = re.findall(r"\b\d{4}-\d{2}-\d{2}\b", text)
+    # Cheap substring check first; only a hit needs the token scan
+    if date_only_str not in text:
+        return False
 
-    return date_only_str in dates_in_text
+    return date_only_str in _ISO_DATE_RE.findall(text)
 
 
+def extract_umm_fields(umm: dict, default_id: str = "N/A") -> Tuple[str, str, str, str]:
+    """Return (GranuleUR, begin time, end time, GET DATA URL) of a CMR granule."""
+    range_date_time = umm.get("TemporalExtent", {}).get("RangeDateTime", {})
+    download_url = next(
+        (
+            url_entry.get("URL", "N/A")
+            for url_entry in umm.get("RelatedUrls", ())
+            if url_entry.get("Type") == "GET DATA"
+        ),
+        "N/A",
+    )
+    return (
+        umm.get("GranuleUR", default_id),
+        range_date_time.get("BeginningDateTime", "N/A"),
+        range_date_time.get("EndingDateTime", "N/A"),
+        download_url,
+    )
+
+
+@lru_cache(maxsize=32)
 def style_function_factory(dataset_color: str,
                            inactive_color: str = "lightgray"):
     def style_function(feature):
@@ -465,10 +606,83 @@ def valid_drcs_datetime(s):
         )
 
 
+@lru_cache(maxsize=1)
+def _timezone_finder() -> TimezoneFinder:
+    """Return a shared TimezoneFinder (its construction loads the tz data)."""
+    return TimezoneFinder()
+
+
+def _index_overpass_result(result, sat_name):
+    """Parse one satellite's overpass table into a queryable index."""
+    if not result:
+        return None
+
+    info_text = result.get("next_collect_info", "")
+    geometry_list = result.get("next_collect_geometry", [])
+
+    # Clean lines from headers/separators
+    relevant_lines = []
+    for line in info_text.split("\n"):
+        strip = line.strip()
+        if not strip.startswith("|") or strip.startswith("|   #"):
+            continue
+        if any(key in strip for key in ["Direction", "Path", "Row",
+                                        "Mission", "Passes dates"]):
+            continue
+        relevant_lines.append(line)
+
+    lines = []
+    polygons = []
+    dates = []
+    for line, poly in zip(relevant_lines, geometry_list):
+        if not isinstance(poly, Polygon):
+            continue
+        # Extract datetimes
+        if sat_name == "Landsat":
+            dt_list = [
+                datetime.strptime(dt_str, "%m/%d/%Y").replace(tzinfo=timezone.utc)
+                for dt_str in re.findall(r"\d{2}/\d{2}/\d{4}", line)
+            ]
+        else:
+            dt_list = [
+                datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+                for dt_str in re.findall(
+                    r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", line
+                )
+            ]
+        lines.append(line)
+        polygons.append(poly)
+        dates.append(dt_list)
+
+    return {
+        "lines": lines,
+        "polygons": polygons,
+        "dates": dates,
+        "tree": shapely.STRtree(polygons),
+    }
+
+
+def build_overpass_index(result_s1, result_s2, result_l):
+    """
+    Parse the Sentinel-1/Sentinel-2/Landsat overpass results once so
+    that check_opera_overpass_intersection can be called per granule
+    without re-reading the tables.
+
+    Returns:
+        dict: satellite name -> parsed index (None when no results)
+    """
+    return {
+        "Sentinel-1": _index_overpass_result(result_s1, "Sentinel-1"),
+        "Sentinel-2": _index_overpass_result(result_s2, "Sentinel-2"),
+        "Landsat": _index_overpass_result(result_l, "Landsat"),
+    }
+
+
 def check_opera_overpass_intersection(product_label, product_geom,
                                       result_s1, result_s2,
                                       result_l, event_date,
-                                      dataset_name: str | None = None):
+                                      dataset_name: str | None = None,
+                                      overpass_index: dict | None = None):
     """
     Check if a given product overlaps with any satellite overpass
     after the event date, and produce a formatted text report.
@@ -479,6 +693,8 @@ def check_opera_overpass_intersection(product_label, product_geom,
         result_s1, result_s2, result_l (dict): overpass info dicts
         event_date (datetime): the event datetime
         dataset_name (str | None): OPERA dataset short name (optional)
+        overpass_index (dict | None): output of build_overpass_index for
+            the same results; built on the fly when omitted
 
     Returns:
         str: formatted report of past recent and future overlapping overpasses
@@ -491,47 +707,33 @@ def check_opera_overpass_intersection(product_label, product_geom,
     if "S1" in label_tokens or any(
         key in dataset_upper for key in ("RTC-S1", "CSLC-S1", "DISP-S1", "DSWX-S1")
     ):
-        result = result_s1
         sat_name = "Sentinel-1"
     elif "S2" in label_tokens:
-        result = result_s2
         sat_name = "Sentinel-2"
     elif "L8" in label_tokens or "L9" in label_tokens:
-        result = result_l
         sat_name = "Landsat"
     else:
         dataset_hint = f" (dataset={dataset_name})" if dataset_name else ""
         return f"Unknown satellite for product {product_label}{dataset_hint}"
 
-    if not result:
+    if overpass_index is None:
+        overpass_index = build_overpass_index(result_s1, result_s2, result_l)
+    index = overpass_index[sat_name]
+    if index is None:
         return f"No overpass results available for {sat_name}"
 
-    info_text = result.get("next_collect_info", "")
-    geometry_list = result.get("next_collect_geometry", [])
-
-    # Clean lines from headers/separators
-    lines = info_text.split("\n")
-    relevant_lines = []
-    for line in lines:
-        strip = line.strip()
-        if not strip.startswith("|") or strip.startswith("|   #"):
-            continue
-        if any(key in strip for key in ["Direction", "Path", "Row",
-                                        "Mission", "Passes dates"]):
-            continue
-        relevant_lines.append(line)
-
     past_overpasses = []
     future_overpasses = []
 
-    tf = TimezoneFinder()
+    tf = _timezone_finder()
+    # Only overpass polygons whose envelope meets the product are tested;
+    # sorting keeps the table order for equal timestamps
+    hits = sorted(index["tree"].query(product_geom, predicate="intersects"))
+
     # Loop over lines and corresponding geometries
-    for line, poly in zip(relevant_lines, geometry_list):
-        if not isinstance(poly, Polygon):
-            continue
-        if not product_geom.intersects(poly):
-            continue
-        inter = product_geom.intersection(poly)
+    for position in hits:
+        line = index["lines"][position]
+        inter = product_geom.intersection(index["polygons"][position])
         if inter.is_empty:
             continue
         overlap_pct = (inter.area / product_geom.area) * 100.0
@@ -546,27 +748,8 @@ def check_opera_overpass_intersection(product_label, product_geom,
 
         bbox_tz = ZoneInfo(timezone_name)
 
-        # Extract datetimes
-        if sat_name == 'Landsat':
-            dt_strings = re.findall(r"\d{2}/\d{2}/\d{4}", line)
-            dt_list = [
-                datetime.strptime(dt_str, "%m/%d/%Y"
-                                  ).replace(
-                                    tzinfo=timezone.utc)
-                for dt_str in dt_strings
-            ]
-        else:
-            dt_strings = re.findall(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
-                                    line)
-            dt_list = [
-                datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S"
-                                  ).replace(
-                                    tzinfo=timezone.utc)
-                for dt_str in dt_strings
-            ]
-
         # Keep only post-event
-        dt_list = [dt for dt in dt_list if dt >= event_date]
+        dt_list = [dt for dt in index["dates"][position] if dt >= event_date]
         if not dt_list:
             continue
 